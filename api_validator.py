@@ -37,7 +37,7 @@ class APIValidator(LoggerMixin):
         expected_types = self.config.EXPECTED_CONTENT_TYPES
         
         if not any(ct in content_type for ct in expected_types):
-            self.log_warning(f"Unexpected content type: {content_type}")
+            self.log_warning("Unexpected content type: %s", content_type)
         
         # Check response length
         if len(response.text) < self.config.MIN_RESPONSE_LENGTH:
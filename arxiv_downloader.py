@@ -1,24 +1,33 @@
 import os
 import re
 import time
+import threading
 import requests
 import xml.etree.ElementTree as ET
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 from urllib.parse import quote_plus
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 
 from models import Paper, ValidationError, NetworkError, ParseError
 from config import Config
 from logger import get_logger
 from cache import CacheManager
+from arxiv_parser import ENTRY_TAG, parse_entry
 from utils import (
     sanitize_filename, 
     is_valid_date_format, 
-    generate_query_hash
+    generate_query_hash,
+    drop_page_cache,
+    strip_arxiv_version,
+    arxiv_id_from_url
 )
 
+def _fmt_arxiv_date(date: str, suffix: str) -> str:
+    """Format YYYY-MM-DD date as ArXiv submittedDate bound (YYYYMMDDHHMM)"""
+    return f"{date[:4]}{date[5:7]}{date[8:10]}{suffix}"
+
 class SearchField(Enum):
     """Search field enumeration"""
     ALL = "all"
@@ -44,16 +53,19 @@ class SortOrder(Enum):
 
 @dataclass
 class DownloadStats:
-    """Download statistics"""
+    """Download statistics, safe to update from download threads"""
     total_papers: int = 0
     successful_downloads: int = 0
     failed_downloads: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
     
     def add_success(self):
-        self.successful_downloads += 1
+        with self._lock:
+            self.successful_downloads += 1
     
     def add_failure(self):
-        self.failed_downloads += 1
+        with self._lock:
+            self.failed_downloads += 1
     
     @property
     def success_rate(self) -> float:
@@ -73,17 +85,17 @@ class ArxivDownloader:
         self.cache_manager = CacheManager()
         self.stats = DownloadStats()
     
-    def log_info(self, message: str):
-        """Log info message"""
-        self.logger.info(message)
+    def log_info(self, message: str, *args: Any):
+        """Log info message, %-formatted with args only if emitted"""
+        self.logger.info(message, *args)
     
-    def log_warning(self, message: str):
-        """Log warning message"""
-        self.logger.warning(message)
+    def log_warning(self, message: str, *args: Any):
+        """Log warning message, %-formatted with args only if emitted"""
+        self.logger.warning(message, *args)
     
-    def log_error(self, message: str):
-        """Log error message"""
-        self.logger.error(message)
+    def log_error(self, message: str, *args: Any):
+        """Log error message, %-formatted with args only if emitted"""
+        self.logger.error(message, *args)
     
     def search_papers(self, query: str = Config.DEFAULT_QUERY,
                      date_from: Optional[str] = None, 
@@ -121,8 +133,14 @@ class ArxivDownloader:
         
         cached_results = self.cache_manager.get_search_results(query_hash)
         if cached_results is not None:
-            self.log_info(f"Retrieved search results from cache, {len(cached_results)} papers total")
-            return [Paper(**paper_data) for paper_data in cached_results]
+            try:
+                cached_papers = [Paper.from_tuple(row) for row in cached_results]
+            except (TypeError, ValidationError):
+                # Entry written in an older (dict based) cache format
+                self.log_warning("Ignoring outdated search cache entry")
+            else:
+                self.log_info("Retrieved search results from cache, %d papers total", len(cached_papers))
+                return cached_papers
         
         # Build search query
         search_query = self._build_search_query(query, date_from, date_to)
@@ -130,21 +148,24 @@ class ArxivDownloader:
         params = {
             'search_query': search_query,
             'start': 0,
-            'max_results': max_results,
-            'sortBy': 'relevance',
-            'sortOrder': 'descending'
+            'max_results': max_results
         }
         
+        # Ordering an ID lookup is meaningless, leave it to the server default
+        if not search_query.startswith('id:'):
+            params['sortBy'] = 'relevance'
+            params['sortOrder'] = 'descending'
+        
         self.log_info("Searching ArXiv papers...")
         
         try:
             response = self._make_request_with_retry(self.base_url, params)
             papers = self._parse_arxiv_response(response.text)
             
-            paper_data_list = [self._paper_to_dict(paper) for paper in papers]
-            self.cache_manager.save_search_results(query_hash, paper_data_list)
+            # Only buffered in memory here, the cache manager writes it out in batches
+            self.cache_manager.save_search_results(query_hash, [paper.to_tuple() for paper in papers])
             
-            self.log_info(f"Search completed, found {len(papers)} papers")
+            self.log_info("Search completed, found %d papers", len(papers))
             return papers
              
         except requests.RequestException as e:
@@ -171,12 +192,9 @@ class ArxivDownloader:
         # Add date range filter
         if date_from or date_to:
             date_filter = "submittedDate:"
-            if date_from and date_to:
-                date_filter += f"[{date_from.replace('-', '')}0000+TO+{date_to.replace('-', '')}2359]"
-            elif date_from:
-                date_filter += f"[{date_from.replace('-', '')}0000+TO+*]"
-            elif date_to:
-                date_filter += f"[*+TO+{date_to.replace('-', '')}2359]"
+            lower = _fmt_arxiv_date(date_from, "0000") if date_from else "*"
+            upper = _fmt_arxiv_date(date_to, "2359") if date_to else "*"
+            date_filter += f"[{lower}+TO+{upper}]"
             
             search_query += f"+AND+{date_filter}"
         
@@ -208,7 +226,7 @@ class ArxivDownloader:
                     raise NetworkError(f"Request failed after {max_retries} retries: {e}")
                 
                 wait_time = Config.RETRY_DELAY_BASE ** attempt
-                self.log_warning(f"Request failed, retrying in {wait_time} seconds ({attempt + 1}/{max_retries}): {e}")
+                self.log_warning("Request failed, retrying in %s seconds (%s/%s): %s", wait_time, attempt + 1, max_retries, e)
                 time.sleep(wait_time)
         
         raise NetworkError("Request retry attempts exhausted")
@@ -227,23 +245,16 @@ class ArxivDownloader:
         """
         try:
             root = ET.fromstring(xml_content)
-            
-            # Define namespaces
-            namespaces = {
-                'atom': 'http://www.w3.org/2005/Atom',
-                'arxiv': 'http://arxiv.org/schemas/atom'
-            }
+            entries = root.findall(ENTRY_TAG)
             
             papers = []
-            entries = root.findall('atom:entry', namespaces)
-            
             for entry in entries:
                 try:
-                    paper = self._parse_entry(entry, namespaces)
+                    paper = self._parse_entry(entry)
                     if paper:
                         papers.append(paper)
                 except Exception as e:
-                    self.log_warning(f"Failed to parse entry: {e}")
+                    self.log_warning("Failed to parse entry: %s", e)
                     continue
             
             return papers
@@ -251,72 +262,27 @@ class ArxivDownloader:
         except ET.ParseError as e:
             raise ParseError(f"XML parsing failed: {e}")
     
-    def _parse_entry(self, entry, namespaces: Dict[str, str]) -> Optional[Paper]:
+    def _parse_entry(self, entry) -> Optional[Paper]:
         """Parse single entry from ArXiv response
         
         Args:
             entry: XML entry element
-            namespaces: XML namespaces
         
         Returns:
             Paper object or None if parsing failed
         """
-        try:
-            # Extract basic information
-            title = entry.find('atom:title', namespaces)
-            title_text = title.text.strip().replace('\n', ' ') if title is not None else "Unknown Title"
-            
-            summary = entry.find('atom:summary', namespaces)
-            summary_text = summary.text.strip().replace('\n', ' ') if summary is not None else ""
-            
-            # Extract ArXiv ID from URL
-            id_elem = entry.find('atom:id', namespaces)
-            if id_elem is None:
-                return None
-            
-            arxiv_id = id_elem.text.split('/')[-1]
-            
-            # Extract authors
-            authors = []
-            author_elements = entry.findall('atom:author', namespaces)
-            for author_elem in author_elements:
-                name_elem = author_elem.find('atom:name', namespaces)
-                if name_elem is not None:
-                    authors.append(name_elem.text.strip())
-            
-            # Extract categories
-            categories = []
-            category_elements = entry.findall('atom:category', namespaces)
-            for cat_elem in category_elements:
-                term = cat_elem.get('term')
-                if term:
-                    categories.append(term)
-            
-            # Extract publication date
-            published = entry.find('atom:published', namespaces)
-            published_text = published.text if published is not None else ""
-            
-            # Extract PDF URL
-            pdf_url = ""
-            link_elements = entry.findall('atom:link', namespaces)
-            for link in link_elements:
-                if link.get('type') == 'application/pdf':
-                    pdf_url = link.get('href', '')
-                    break
-            
-            return Paper(
-                id=arxiv_id,
-                title=title_text,
-                authors=authors,
-                abstract=summary_text,
-                categories=categories,
-                published=published_text,
-                pdf_url=pdf_url
-            )
-            
-        except Exception as e:
-            self.log_warning(f"Failed to parse paper entry: {e}")
-            return None
+        return parse_entry(entry)
+    
+    def paper_filepath(self, paper: Paper) -> Path:
+        """Build the path download_pdf saves a paper to
+        
+        Args:
+            paper: Paper object
+        
+        Returns:
+            File path in the download directory
+        """
+        return self.download_dir / f"{sanitize_filename(paper.title)}_{paper.id}.pdf"
     
     def download_pdf(self, paper: Paper) -> bool:
         """Download single paper PDF
@@ -327,44 +293,49 @@ class ArxivDownloader:
         Returns:
             Whether download was successful
         """
+        part_path: Optional[Path] = None
         try:
             if not paper.pdf_url:
-                self.log_error(f"No PDF URL found for paper: {paper.title}")
+                self.log_error("No PDF URL found for paper: %s", paper.title)
                 return False
             
-            # Generate filename
-            clean_title = sanitize_filename(paper.title)
-            filename = f"{clean_title}_{paper.id}.pdf"
-            filepath = self.download_dir / filename
+            filepath = self.paper_filepath(paper)
+            filename = filepath.name
             
             # Check if file already exists
             if filepath.exists():
-                self.log_info(f"File already exists, skipping: {filename}")
+                self.log_info("File already exists, skipping: %s", filename)
                 return True
             
-            self.log_info(f"Downloading: {paper.title}")
+            # Written under a temporary name and renamed when complete, so an
+            # interrupted download never passes the exists check
+            part_path = filepath.with_name(filename + '.part')
+            
+            self.log_info("Downloading: %s", paper.title)
             
             # Download file
             response = self._download_with_retry(paper.pdf_url)
             
             # Save file
-            with open(filepath, 'wb') as f:
+            with open(part_path, 'wb', buffering=Config.WRITE_BUFFER_SIZE) as f:
                 for chunk in response.iter_content(chunk_size=8192):
                     if chunk:
                         f.write(chunk)
+                drop_page_cache(f)
+            os.replace(part_path, filepath)
             
-            self.log_info(f"Downloaded successfully: {filename}")
+            self.log_info("Downloaded successfully: %s", filename)
             self.stats.add_success()
             return True
             
         except Exception as e:
-            self.log_error(f"Download failed for {paper.title}: {e}")
+            self.log_error("Download failed for %s: %s", paper.title, e)
             # Clean up partial file
-            try:
-                if 'filepath' in locals() and filepath.exists():
-                    filepath.unlink()
-            except Exception:
-                pass
+            if part_path is not None:
+                try:
+                    part_path.unlink(missing_ok=True)
+                except OSError:
+                    pass
             
             self.stats.add_failure()
             return False
@@ -378,40 +349,60 @@ class ArxivDownloader:
         Returns:
             Whether download was successful
         """
-        try:
-            # Remove version number (if exists)
-            # ArXiv ID format: YYMM.NNNNN[vN]
-            clean_paper_id = paper_id
-            if 'v' in paper_id:
-                clean_paper_id = paper_id.split('v')[0]
-            
-            # Build search query for exact ID search
-            query = f"id:{clean_paper_id}"
-            
-            self.log_info(f"Searching paper ID: {paper_id} (cleaned: {clean_paper_id})")
-            
-            # Search papers
-            papers = self.search_papers(query=query, max_results=1)
-            
-            if not papers:
-                self.log_error(f"Paper ID not found: {paper_id} (search ID: {clean_paper_id})")
-                return False
-            
-            paper = papers[0]
-            
-            # Download paper
-            success = self.download_pdf(paper)
+        return self.download_papers_by_ids([paper_id])[paper_id]
+    
+    def download_papers_by_ids(self, paper_ids: List[str]) -> Dict[str, bool]:
+        """Download papers by ArXiv IDs, resolving up to Config.ID_BATCH_SIZE IDs per API request
+        
+        Args:
+            paper_ids: ArXiv paper IDs, with or without version suffix
+        
+        Returns:
+            Mapping of each requested ID to whether its download was successful
+        """
+        results = {paper_id: False for paper_id in paper_ids}
+        if not paper_ids:
+            return results
+        
+        # Versionless IDs resolve to the latest version
+        clean_ids = {paper_id: strip_arxiv_version(paper_id) for paper_id in paper_ids}
+        unique_ids = list(dict.fromkeys(clean_ids.values()))
+        
+        self.log_info("Resolving %d paper IDs", len(unique_ids))
+        
+        papers_by_id = {}
+        for start in range(0, len(unique_ids), Config.ID_BATCH_SIZE):
+            batch = unique_ids[start:start + Config.ID_BATCH_SIZE]
+            params = {
+                'id_list': ','.join(batch),
+                'start': 0,
+                'max_results': len(batch)
+            }
             
-            if success:
-                self.log_info(f"Paper downloaded successfully: {paper.title}")
+            try:
+                response = self._make_request_with_retry(self.base_url, params)
+                papers = self._parse_arxiv_response(response.text)
+            except (NetworkError, ParseError) as e:
+                self.log_error("Failed to resolve paper IDs %s: %s", ', '.join(batch), e)
+                continue
+            
+            # Paper.id drops the archive of old-style IDs (hep-th/9901001), the PDF URL keeps it
+            papers_by_id.update((strip_arxiv_version(arxiv_id_from_url(paper.pdf_url)), paper)
+                                for paper in papers)
+        
+        for paper_id, clean_id in clean_ids.items():
+            paper = papers_by_id.get(clean_id)
+            if paper is None:
+                self.log_error("Paper ID not found: %s (search ID: %s)", paper_id, clean_id)
+                continue
+            
+            results[paper_id] = self.download_pdf(paper)
+            if results[paper_id]:
+                self.log_info("Paper downloaded successfully: %s", paper.title)
             else:
-                self.log_error(f"Paper download failed: {paper.title}")
-            
-            return success
-            
-        except Exception as e:
-            self.log_error(f"Download by ID failed for {paper_id}: {e}")
-            return False
+                self.log_error("Paper download failed: %s", paper.title)
+        
+        return results
     
     def _download_with_retry(self, url: str, max_retries: int = Config.MAX_RETRIES) -> requests.Response:
         """File download with retry mechanism
@@ -437,7 +428,7 @@ class ArxivDownloader:
                     raise NetworkError(f"Download failed after {max_retries} retries: {e}")
                 
                 wait_time = Config.RETRY_DELAY_BASE ** attempt
-                self.log_warning(f"Download failed, retrying in {wait_time} seconds ({attempt + 1}/{max_retries}): {e}")
+                self.log_warning("Download failed, retrying in %s seconds (%s/%s): %s", wait_time, attempt + 1, max_retries, e)
                 time.sleep(wait_time)
         
         raise NetworkError("Download retry attempts exhausted")
@@ -452,20 +443,20 @@ class ArxivDownloader:
             self.log_info("No papers found")
             return
         
-        self.log_info(f"Found {len(papers)} papers, starting download...")
+        self.log_info("Found %d papers, starting download...", len(papers))
         
         # Reset statistics
         self.stats = DownloadStats()
         self.stats.total_papers = len(papers)
         
         for i, paper in enumerate(papers, 1):
-            self.log_info(f"Processing paper {i}/{len(papers)}: {paper.title}")
+            self.log_info("Processing paper %d/%d: %s", i, len(papers), paper.title)
             self.download_pdf(paper)
         
         # Print statistics
-        self.log_info(f"Download completed. Success: {self.stats.successful_downloads}, "
-                     f"Failed: {self.stats.failed_downloads}, "
-                     f"Success rate: {self.stats.success_rate:.1f}%")
+        self.log_info("Download completed. Success: %d, Failed: %d, Success rate: %.1f%%",
+                      self.stats.successful_downloads, self.stats.failed_downloads,
+                      self.stats.success_rate)
     
     def _paper_to_dict(self, paper: Paper) -> Dict[str, Any]:
         """Convert Paper object to dictionary for caching
@@ -18,7 +18,7 @@ from models import Paper, DownloadStats, NetworkError, FileOperationError, Parse
 from logger import setup_logging, LoggerMixin
 from cache import CacheManager
 from utils import (
-    sanitize_filename, generate_query_hash, get_file_size_mb,
+    sanitize_filename, generate_query_hash,
     ensure_directory, is_valid_date_format, clean_text,
     validate_url, generate_unique_filename
 )
@@ -294,8 +294,7 @@ class ArxivDownloader(LoggerMixin):
                         f.write(chunk)
             
             # Record statistics
-            file_size_mb = get_file_size_mb(filepath)
-            self.stats.add_success(file_size_mb)
+            self.stats.add_success(filepath.stat().st_size)
             
             self.log_info(f"✓ Download completed: {filepath.name}")
             return True
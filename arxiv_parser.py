@@ -0,0 +1,148 @@
+"""ArXiv Atom entry parsing
+
+Kept free of dynamic typing so it can be compiled to a C extension with
+mypyc (see setup.py); the pure Python module is used when it is not built.
+"""
+
+import xml.etree.ElementTree as ET
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type
+
+from models import Paper, ValidationError
+from config import Config
+from logger import get_logger
+
+try:
+    from lxml import etree as lxml_etree  # type: ignore[import-untyped]
+except ImportError:  # optional, the stdlib parser gives the same results, just slower
+    lxml_etree = None
+
+# ArXiv API XML namespaces
+ATOM_NAMESPACES: Dict[str, str] = {
+    'atom': 'http://www.w3.org/2005/Atom',
+    'arxiv': 'http://arxiv.org/schemas/atom'
+}
+
+# Fully qualified tag names, so lookups skip per-call prefix expansion
+_ATOM = '{http://www.w3.org/2005/Atom}'
+_ARXIV = '{http://arxiv.org/schemas/atom}'
+ENTRY_TAG: str = _ATOM + 'entry'
+TITLE_TAG: str = _ATOM + 'title'
+SUMMARY_TAG: str = _ATOM + 'summary'
+ID_TAG: str = _ATOM + 'id'
+AUTHOR_TAG: str = _ATOM + 'author'
+NAME_TAG: str = _ATOM + 'name'
+CATEGORY_TAG: str = _ATOM + 'category'
+PUBLISHED_TAG: str = _ATOM + 'published'
+LINK_TAG: str = _ATOM + 'link'
+COMMENT_TAG: str = _ARXIV + 'comment'
+JOURNAL_REF_TAG: str = _ARXIV + 'journal_ref'
+DOI_TAG: str = _ARXIV + 'doi'
+
+# Raised by either parser on malformed XML
+XML_ERRORS: Tuple[Type[Exception], ...] = (
+    (ET.ParseError,) + ((lxml_etree.XMLSyntaxError,) if lxml_etree is not None else ())
+)
+
+def iter_entries(source: Any) -> Iterator[Any]:
+    """Yield feed entry elements as they finish parsing, freeing each one after use
+    
+    Memory stays constant however many entries the feed holds. The elements
+    are lxml ones when lxml is installed and ElementTree ones otherwise; both
+    support find/findall/get.
+    
+    Args:
+        source: File name or binary file-like object holding an Atom feed
+    
+    Yields:
+        Entry elements, each valid only until the next one is yielded
+    """
+    if lxml_etree is not None:
+        for _, entry in lxml_etree.iterparse(source, events=('end',), tag=ENTRY_TAG):
+            yield entry
+            entry.clear()
+            # lxml keeps cleared siblings attached to the root, drop them too
+            while entry.getprevious() is not None:
+                del entry.getparent()[0]
+    else:
+        root = None
+        for event, elem in ET.iterparse(source, events=('start', 'end')):
+            if root is None:
+                root = elem
+            elif event == 'end' and elem.tag == ENTRY_TAG:
+                yield elem
+                root.clear()
+
+def _norm(text: Optional[str]) -> str:
+    """Strip text and collapse every whitespace run, newlines included, to one space"""
+    if not text:
+        return ""
+    if '\n' in text or '  ' in text or '\t' in text:
+        return Config.WHITESPACE_RE.sub(' ', text).strip()
+    return text.strip()
+
+def parse_entry(entry: ET.Element) -> Optional[Paper]:
+    """Parse single entry from ArXiv response
+    
+    Args:
+        entry: XML entry element
+    
+    Returns:
+        Paper object or None if parsing failed
+    """
+    try:
+        # Extract basic information
+        title = entry.find(TITLE_TAG)
+        title_text: str = _norm(title.text) if title is not None and title.text else "Unknown Title"
+        
+        summary = entry.find(SUMMARY_TAG)
+        summary_text: str = _norm(summary.text) if summary is not None else ""
+        
+        # Extract ArXiv ID from URL
+        id_elem = entry.find(ID_TAG)
+        if id_elem is None or not id_elem.text:
+            return None
+        
+        id_url: str = id_elem.text
+        arxiv_id: str = id_url[id_url.rfind('/') + 1:]
+        
+        # Extract authors
+        authors: List[str] = []
+        for author_elem in entry.findall(AUTHOR_TAG):
+            name_elem = author_elem.find(NAME_TAG)
+            if name_elem is not None and name_elem.text:
+                authors.append(name_elem.text.strip())
+        
+        # Extract categories
+        categories: List[str] = []
+        for cat_elem in entry.findall(CATEGORY_TAG):
+            term = cat_elem.get('term')
+            if term:
+                categories.append(term)
+        
+        # Extract publication date
+        published = entry.find(PUBLISHED_TAG)
+        published_text: str = (published.text or "") if published is not None else ""
+        
+        # Extract PDF URL
+        pdf_url: str = next((link.get('href', '') for link in entry.iterfind(LINK_TAG)
+                             if link.get('type') == 'application/pdf'), "")
+        
+        # The lists are built here, so only these need the checks Paper() would run
+        if not arxiv_id or not title_text:
+            raise ValidationError("Paper ID and title cannot be empty")
+        if not pdf_url.startswith('http'):
+            raise ValidationError("Invalid PDF URL")
+        
+        return Paper._unchecked(
+            id=arxiv_id,
+            title=title_text,
+            authors=authors,
+            abstract=summary_text,
+            categories=categories,
+            published=published_text,
+            pdf_url=pdf_url
+        )
+        
+    except Exception as e:
+        get_logger().warning("Failed to parse paper entry: %s", e)
+        return None
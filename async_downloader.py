@@ -7,44 +7,105 @@ Supports high concurrency downloads to improve download efficiency
 
 import asyncio
 import aiohttp
+import os
+import random
+import shutil
 import time
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator, Tuple
 from datetime import datetime
 
 from config import Config
-from models import Paper, DownloadStats, NetworkError, FileOperationError
+from models import Paper, DownloadStats, NetworkError, RateLimitError, FileOperationError
 from logger import LoggerMixin
-from utils import sanitize_filename, get_file_size_mb, generate_unique_filename
+try:
+    import aiofiles
+except ImportError:  # optional, writes fall back to the default thread pool
+    aiofiles = None
+
+from utils import (
+    sanitize_filename, drop_page_cache_fd, parse_retry_after, scan_downloaded_ids
+)
+
+class AsyncRateLimiter:
+    """Spaces requests evenly so at most max_rate start per time_period
+    
+    Acquisitions reserve the next free slot and sleep until it arrives, so
+    waiting tasks are released one interval apart instead of in a burst.
+    """
+    
+    def __init__(self, max_rate: float, time_period: float = 1.0):
+        """Initialize rate limiter
+        
+        Args:
+            max_rate: Requests allowed per time period
+            time_period: Period length in seconds
+        """
+        self.interval = time_period / max_rate
+        self._next_slot = 0.0
+    
+    async def acquire(self) -> None:
+        """Wait until the next request may start"""
+        now = asyncio.get_running_loop().time()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+    
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
 
 class AsyncArxivDownloader(LoggerMixin):
     """Async ArXiv Paper Downloader"""
     
     def __init__(self, download_dir: Optional[str] = None, 
-                 max_concurrent: int = Config.MAX_CONCURRENT_DOWNLOADS):
+                 max_concurrent: int = Config.MAX_CONCURRENT_DOWNLOADS,
+                 session: Optional[aiohttp.ClientSession] = None,
+                 connector: Optional[aiohttp.BaseConnector] = None,
+                 rate_limiter: Optional[AsyncRateLimiter] = None):
         """Initialize async downloader
         
         Args:
             download_dir: Download directory path
             max_concurrent: Maximum concurrent downloads
+            session: Existing session to reuse, it is not closed on exit
+            connector: Connector for the session created on entry, a pooled
+                connector sized to max_concurrent is used if None
+            rate_limiter: Limiter applied to every HTTP request, unlimited if None
         """
         self.download_dir = Config.get_download_dir(download_dir)
         self.download_dir.mkdir(parents=True, exist_ok=True)
         
         self.max_concurrent = max_concurrent
         self.stats = DownloadStats()
-        self.session: Optional[aiohttp.ClientSession] = None
+        self.session: Optional[aiohttp.ClientSession] = session
+        self._owns_session = session is None
+        self._connector = connector
+        self.rate_limiter = rate_limiter
+        self._inflight: Dict[str, asyncio.Task] = {}
         
-        self.log_info(f"Async downloader initialized, max concurrent: {max_concurrent}")
+        self.log_info("Async downloader initialized, max concurrent: %s", max_concurrent)
     
     async def __aenter__(self):
         """Async context manager entry"""
-        connector = aiohttp.TCPConnector(
-            limit=self.max_concurrent * 2,
-            limit_per_host=self.max_concurrent,
-            ttl_dns_cache=300,
-            use_dns_cache=True,
-        )
+        if not self._owns_session:
+            return self
+        
+        connector = self._connector
+        if connector is None:
+            # Downloads are bounded by the semaphore, so the pool never needs more
+            # than max_concurrent sockets; idle ones are kept alive for reuse
+            connector = aiohttp.TCPConnector(
+                limit=self.max_concurrent,
+                limit_per_host=min(self.max_concurrent, Config.MAX_CONNECTIONS_PER_HOST),
+                ttl_dns_cache=Config.DNS_CACHE_TTL,
+                use_dns_cache=True,
+                keepalive_timeout=Config.KEEPALIVE_TIMEOUT,
+            )
         
         timeout = aiohttp.ClientTimeout(
             total=Config.DOWNLOAD_TIMEOUT,
@@ -62,9 +123,27 @@ class AsyncArxivDownloader(LoggerMixin):
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit"""
-        if self.session:
+        if self.session and self._owns_session:
             await self.session.close()
     
+    async def prewarm(self, url: str) -> None:
+        """Open a pooled connection to the download host ahead of time
+        
+        Resolves DNS and completes the TCP/TLS handshake so the first real
+        download starts immediately. Failures are ignored.
+        
+        Args:
+            url: Any URL on the host papers will be downloaded from
+        """
+        if not self.session:
+            raise RuntimeError("Please use async downloader within async with statement")
+        
+        try:
+            async with self.session.head(url, allow_redirects=True):
+                pass
+        except Exception as e:
+            self.log_debug("Connection prewarm failed for %s: %s", url, e)
+    
     async def download_papers_async(self, papers: List[Paper]) -> Dict[str, Any]:
         """Async batch download papers
         
@@ -80,34 +159,41 @@ class AsyncArxivDownloader(LoggerMixin):
         start_time = time.time()
         semaphore = asyncio.Semaphore(self.max_concurrent)
         
-        self.log_info(f"Starting async download of {len(papers)} papers")
+        self.stats.reset()
+        self.stats.total_papers = len(papers)
         
-        # Create download tasks
-        tasks = [
-            self._download_single_async(paper, semaphore)
-            for paper in papers
-        ]
+        # One directory scan instead of an exists() check per task
+        existing_ids = scan_downloaded_ids(self.download_dir)
+        pending = [paper for paper in papers if paper.id not in existing_ids]
+        already_downloaded = len(papers) - len(pending)
+        self.stats.skipped_downloads += already_downloaded
         
-        # Execute all download tasks
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        self.log_info(
+            "Starting async download of %d papers (%d already downloaded)",
+            len(pending), already_downloaded
+        )
         
-        # Count results
-        successful = sum(1 for r in results if r is True)
-        failed = sum(1 for r in results if isinstance(r, Exception))
-        skipped = len(results) - successful - failed
+        # A fixed pool of workers pulls (paper, filepath) jobs from one lazy iterator,
+        # so only max_concurrent tasks exist however large the batch is. Paths are
+        # built outside the semaphore so workers only hold it for I/O
+        jobs = ((paper, self._paper_filepath(paper)) for paper in pending)
+        workers = [
+            asyncio.create_task(self._download_worker(jobs, semaphore))
+            for _ in range(min(self.max_concurrent, len(pending)))
+        ]
+        await asyncio.gather(*workers)
+        
+        successful = self.stats.successful_downloads
+        failed = self.stats.failed_downloads
+        skipped = self.stats.skipped_downloads
         
         end_time = time.time()
         total_time = end_time - start_time
-        
-        self.stats.successful_downloads = successful
-        self.stats.failed_downloads = failed
-        self.stats.skipped_downloads = skipped
-        self.stats.total_papers = len(papers)
         self.stats.download_time_seconds = total_time
         
         self.log_info(
-            f"Async download completed: successful {successful}, failed {failed}, skipped {skipped}, "
-            f"time taken {total_time:.2f} seconds"
+            "Async download completed: successful %d, failed %d, skipped %d, time taken %.2f seconds",
+            successful, failed, skipped, total_time
         )
         
         return {
@@ -118,63 +204,231 @@ class AsyncArxivDownloader(LoggerMixin):
             'stats': self.stats
         }
     
-    async def _download_single_async(self, paper: Paper, semaphore: asyncio.Semaphore) -> bool:
+    async def _download_worker(self, jobs: Iterator[Tuple[Paper, Path]],
+                               semaphore: asyncio.Semaphore) -> None:
+        """Download papers until the shared job iterator is exhausted
+        
+        Args:
+            jobs: Iterator of (paper, filepath) jobs shared by all workers
+            semaphore: Semaphore for concurrency control
+        """
+        # next() never awaits, so workers cannot receive the same job
+        for paper, filepath in jobs:
+            try:
+                if await self._download_single_async(paper, semaphore, filepath):
+                    self.stats.add_success()
+                else:
+                    self.stats.add_skip()
+            except Exception:
+                self.stats.add_failure()
+            
+            finished = (self.stats.successful_downloads + self.stats.failed_downloads
+                        + self.stats.skipped_downloads)
+            self.log_info("Progress: %s/%s", finished, self.stats.total_papers)
+    
+    async def _download_single_async(self, paper: Paper,
+                                     semaphore: Optional[asyncio.Semaphore] = None,
+                                     filepath: Optional[Path] = None) -> bool:
         """Async download single paper
         
         Args:
             paper: Paper object
-            semaphore: Semaphore for concurrency control
+            semaphore: Semaphore for concurrency control, None for no gating
+            filepath: Target file path, derived from the paper if None
         
         Returns:
             Whether download was successful
         """
+        # Duplicate requests for a paper share the download already in flight
+        task = self._inflight.get(paper.id)
+        if task is not None:
+            self.log_info("Download already in progress, waiting: %s", paper.id)
+            return await asyncio.shield(task)
+        
+        if filepath is None:
+            filepath = self._paper_filepath(paper)
+        
+        task = asyncio.ensure_future(self._download_gated(paper, semaphore, filepath))
+        self._inflight[paper.id] = task
+        try:
+            return await task
+        finally:
+            self._inflight.pop(paper.id, None)
+    
+    async def _download_gated(self, paper: Paper, semaphore: Optional[asyncio.Semaphore],
+                              filepath: Path) -> bool:
+        """Download single paper, holding the semaphore if given"""
+        if semaphore is None:
+            return await self._download_paper(paper, filepath)
+        
         async with semaphore:
-            try:
-                # Generate filename
-                clean_title = sanitize_filename(paper.title)
-                filename = f"{paper.id}_{clean_title}.pdf"
-                filepath = self.download_dir / filename
-                
-                # Check if file already exists
-                if filepath.exists():
-                    self.log_info(f"File already exists, skipping download: {filename}")
-                    return True
+            return await self._download_paper(paper, filepath)
+    
+    def _paper_filepath(self, paper: Paper) -> Path:
+        """Build download file path for a paper
+        
+        Args:
+            paper: Paper object
+        
+        Returns:
+            File path in the download directory
+        """
+        return self.download_dir / f"{paper.id}_{sanitize_filename(paper.title)}.pdf"
+    
+    async def _download_paper(self, paper: Paper, filepath: Path) -> bool:
+        """Download single paper
+        
+        Args:
+            paper: Paper object
+            filepath: Target file path
+        
+        Returns:
+            Whether download was successful
+        """
+        filename = filepath.name
+        # Written under a temporary name and renamed when complete, so an
+        # interrupted download never passes the exists check
+        part_path = filepath.with_name(filename + '.part')
+        try:
+            # Check if file already exists
+            if filepath.exists():
+                self.log_info("File already exists, skipping download: %s", filename)
+                return True
+            
+            # Copy from a local mirror when it has the paper (kernel-side, no HTTP)
+            mirror_file = self._mirror_file(paper)
+            if mirror_file is not None:
+                await asyncio.get_running_loop().run_in_executor(
+                    None, shutil.copyfile, mirror_file, part_path
+                )
+                os.replace(part_path, filepath)
+                file_size = filepath.stat().st_size
+                self.stats.total_size_bytes += file_size
+                self.log_info("Copied from local mirror: %s (%.2fMB)", filename, file_size / (1024 * 1024))
+                return True
+            
+            # Download file
+            await self._throttle()
+            async with self.session.get(paper.pdf_url) as response:
+                if response.status in (429, 503):
+                    raise RateLimitError(
+                        f"HTTP {response.status}: {response.reason}",
+                        status=response.status,
+                        retry_after=parse_retry_after(response.headers.get('Retry-After'))
+                    )
+                if response.status != 200:
+                    raise NetworkError(
+                        f"HTTP {response.status}: {response.reason}",
+                        status=response.status
+                    )
                 
-                # Ensure filename is unique
-                filepath = generate_unique_filename(filepath)
+                # Leaving the block unread drops the connection, so an
+                # oversized body is never transferred
+                if not self._size_acceptable(paper, response.headers.get('Content-Length')):
+                    return False
                 
-                # Download file
-                async with self.session.get(paper.pdf_url) as response:
-                    if response.status == 200:
-                        content = await response.read()
-                        
-                        # Write file
-                        with open(filepath, 'wb') as f:
-                            f.write(content)
-                        
-                        file_size = get_file_size_mb(filepath)
-                        self.stats.total_size_mb += file_size
-                        
-                        self.log_info(
-                            f"Download successful: {filename} ({file_size:.2f}MB)"
-                        )
-                        return True
-                    else:
-                        raise NetworkError(
-                            f"HTTP {response.status}: {response.reason}"
-                        )
-            
-            except Exception as e:
-                self.log_error(f"Download failed {paper.id}: {str(e)}")
+                bytes_written = await self._write_stream(response, part_path)
+                os.replace(part_path, filepath)
                 
-                # Clean up incomplete file
-                if filepath.exists():
-                    try:
-                        filepath.unlink()
-                    except Exception:
-                        pass
+                self.stats.total_size_bytes += bytes_written
                 
-                raise e
+                self.log_info(
+                    "Download successful: %s (%.2fMB)", filename, bytes_written / (1024 * 1024)
+                )
+                return True
+        
+        except Exception as e:
+            self.log_error("Download failed %s: %s", paper.id, e)
+            
+            # Clean up incomplete file
+            try:
+                part_path.unlink(missing_ok=True)
+            except OSError:
+                pass
+            
+            raise e
+    
+    async def _write_stream(self, response: aiohttp.ClientResponse, path: Path) -> int:
+        """Stream response body to a file without blocking the event loop
+        
+        Memory stays constant per download. Writes run in a thread pool, via
+        aiofiles when installed, so receiving the next chunk overlaps with
+        flushing the previous one.
+        
+        Args:
+            response: Response to read
+            path: Target file path
+        
+        Returns:
+            Number of bytes written
+        """
+        loop = asyncio.get_running_loop()
+        bytes_written = 0
+        
+        if aiofiles is not None:
+            async with aiofiles.open(path, 'wb', buffering=Config.WRITE_BUFFER_SIZE) as f:
+                async for chunk in response.content.iter_chunked(Config.ASYNC_CHUNK_SIZE):
+                    await f.write(chunk)
+                    bytes_written += len(chunk)
+                await f.flush()
+                await loop.run_in_executor(None, drop_page_cache_fd, f.fileno())
+            return bytes_written
+        
+        f = await loop.run_in_executor(None, open, path, 'wb', Config.WRITE_BUFFER_SIZE)
+        try:
+            async for chunk in response.content.iter_chunked(Config.ASYNC_CHUNK_SIZE):
+                await loop.run_in_executor(None, f.write, chunk)
+                bytes_written += len(chunk)
+            await loop.run_in_executor(None, f.flush)
+            await loop.run_in_executor(None, drop_page_cache_fd, f.fileno())
+        finally:
+            await loop.run_in_executor(None, f.close)
+        return bytes_written
+    
+    async def _throttle(self) -> None:
+        """Wait for the rate limiter, if any, before sending a request"""
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire()
+    
+    def _mirror_file(self, paper: Paper) -> Optional[Path]:
+        """Find paper PDF in the configured local mirror
+        
+        Args:
+            paper: Paper object
+        
+        Returns:
+            Mirror file path, None if no mirror is configured or it lacks the paper
+        """
+        if not Config.LOCAL_MIRROR_PATH:
+            return None
+        
+        mirror_file = Path(Config.LOCAL_MIRROR_PATH) / f"{paper.id}.pdf"
+        return mirror_file if mirror_file.is_file() else None
+    
+    def _size_acceptable(self, paper: Paper, content_length: Optional[str]) -> bool:
+        """Check the PDF size reported by the download response
+        
+        Checked on the GET itself rather than a separate HEAD request, which
+        would take a second rate limiter slot per paper.
+        
+        Args:
+            paper: Paper object
+            content_length: Content-Length header value, if any
+        
+        Returns:
+            False if the reported size is outside the configured bounds,
+            True otherwise (including when the size is unknown)
+        """
+        try:
+            size = int(content_length)
+        except (TypeError, ValueError):
+            return True
+        
+        if not Config.MIN_PDF_BYTES <= size <= Config.MAX_PDF_BYTES:
+            self.log_warning("Skipping %s: reported size %s bytes is out of range", paper.id, size)
+            return False
+        
+        return True
     
     async def download_with_retry_async(self, paper: Paper, max_retries: int = 3) -> bool:
         """Async download with retry mechanism
@@ -188,40 +442,84 @@ class AsyncArxivDownloader(LoggerMixin):
         """
         for attempt in range(max_retries):
             try:
-                semaphore = asyncio.Semaphore(1)
-                return await self._download_single_async(paper, semaphore)
+                return await self._download_single_async(paper)
             
             except Exception as e:
+                # Client errors such as 404 will not succeed on retry
+                if isinstance(e, NetworkError) and not e.retryable:
+                    self.log_error("Download failed, not retrying: %s - %s", paper.id, e)
+                    return False
+                
                 if attempt == max_retries - 1:
                     self.log_error(
-                        f"Download failed after {max_retries} retries: {paper.id} - {str(e)}"
+                        "Download failed after %d retries: %s - %s", max_retries, paper.id, e
                     )
                     return False
                 
-                wait_time = (2 ** attempt) * Config.RETRY_DELAY_BASE
+                wait_time = self._backoff_delay(attempt)
+                if isinstance(e, RateLimitError) and e.retry_after is not None:
+                    wait_time = max(wait_time, e.retry_after)
                 self.log_warning(
-                    f"Download failed, retrying in {wait_time} seconds ({attempt + 1}/{max_retries}): "
-                    f"{paper.id} - {str(e)}"
+                    "Download failed, retrying in %.1f seconds (%d/%d): %s - %s",
+                    wait_time, attempt + 1, max_retries, paper.id, e
                 )
                 await asyncio.sleep(wait_time)
         
         return False
+    
+    @staticmethod
+    def _backoff_delay(attempt: int) -> float:
+        """Exponential backoff with random jitter, capped at Config.RETRY_MAX_DELAY
+        
+        Args:
+            attempt: Zero-based attempt number
+        
+        Returns:
+            Seconds to wait before the next attempt
+        """
+        delay = (2 ** attempt) * Config.RETRY_DELAY_BASE
+        delay *= 1 + random.random() * Config.RETRY_JITTER
+        return min(Config.RETRY_MAX_DELAY, delay)
+
+def use_uvloop() -> bool:
+    """Use uvloop as the asyncio event loop policy if it is installed
+    
+    Call before asyncio.run(); uvloop is optional and the default loop is
+    kept when it is missing (or on Windows, where it is unavailable).
+    
+    Returns:
+        Whether uvloop was installed
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
 
 # Convenience function
 async def download_papers_async(papers: List[Paper], 
                                download_dir: Optional[str] = None,
-                               max_concurrent: int = Config.MAX_CONCURRENT_DOWNLOADS) -> Dict[str, Any]:
+                               max_concurrent: int = Config.MAX_CONCURRENT_DOWNLOADS,
+                               session: Optional[aiohttp.ClientSession] = None,
+                               connector: Optional[aiohttp.BaseConnector] = None,
+                               rate_limiter: Optional[AsyncRateLimiter] = None) -> Dict[str, Any]:
     """Convenient async download function
     
     Args:
         papers: List of papers
         download_dir: Download directory
         max_concurrent: Maximum concurrent downloads
+        session: Existing session to reuse across batches
+        connector: Connector for a newly created session
+        rate_limiter: Limiter applied to every HTTP request
     
     Returns:
         Download result statistics
     """
-    async with AsyncArxivDownloader(download_dir, max_concurrent) as downloader:
+    async with AsyncArxivDownloader(download_dir, max_concurrent, session, connector,
+                                    rate_limiter) as downloader:
         return await downloader.download_papers_async(papers)
 
 if __name__ == "__main__":
@@ -245,4 +543,5 @@ if __name__ == "__main__":
         print(f"Download result: {result}")
     
     # Run example
+    use_uvloop()
     asyncio.run(main())
\ No newline at end of file
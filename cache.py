@@ -1,17 +1,126 @@
 """Cache management module"""
 
 import json
-import pickle
-from datetime import datetime, timedelta
+import os
+import sqlite3
+import threading
+import time
+import weakref
+import zlib
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 
 from config import Config
-from models import Paper
 from logger import LoggerMixin
 
+try:
+    import orjson
+except ImportError:  # optional, falls back to the stdlib json module
+    orjson = None  # type: ignore[assignment]
+
+# Papers, searches and raw API responses share one schema, keyed by
+# paper ID / query hash / request parameter hash
+_TABLES = ('papers', 'searches', 'responses')
+
+def _dumps(value: Any) -> bytes:
+    """Serialize cache payload to UTF-8 JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, ensure_ascii=False).encode('utf-8')
+
+def _loads(data: bytes) -> Any:
+    """Deserialize cache payload from JSON bytes"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _flush_pending(conn: sqlite3.Connection,
+                   pending: Dict[Tuple[str, str], Tuple[int, bytes]]) -> None:
+    """Write buffered entries in one transaction and empty the buffer"""
+    if not pending:
+        return
+    
+    rows: Dict[str, list] = {table: [] for table in _TABLES}
+    for (table, key), (cached_at, payload) in pending.items():
+        rows[table].append((key, cached_at, payload))
+    
+    with conn:
+        for table, table_rows in rows.items():
+            if table_rows:
+                conn.executemany(
+                    f'INSERT OR REPLACE INTO {table} (id, cached_at, payload) VALUES (?, ?, ?)',
+                    table_rows
+                )
+    pending.clear()
+
+def _close_connection(conn: sqlite3.Connection, lock: threading.Lock,
+                      pending: Dict[Tuple[str, str], Tuple[int, bytes]]) -> None:
+    """Flush buffered entries and close the connection (also run at exit)"""
+    with lock:
+        _flush_pending(conn, pending)
+        conn.close()
+
+# Per-file JSON cache directories written by earlier versions
+_LEGACY_DIRS = {'papers': Config.PAPER_CACHE_TTL, 'searches': Config.SEARCH_CACHE_TTL}
+
+class TTLCache:
+    """Thread-safe in-memory LRU cache whose entries expire at a fixed time"""
+    
+    def __init__(self, maxsize: int, ttl: float):
+        """Initialize memory cache
+        
+        Args:
+            maxsize: Maximum number of entries, least recently used are evicted
+            ttl: Default entry lifetime in seconds
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: 'OrderedDict[str, Tuple[float, Any]]' = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get unexpired entry, marking it most recently used"""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+            
+            expires_at, value = item
+            if time.time() >= expires_at:
+                del self._data[key]
+                return default
+            
+            self._data.move_to_end(key)
+            return value
+    
+    def set(self, key: str, value: Any, expires_at: Optional[float] = None) -> None:
+        """Store entry, expiring after ttl unless an explicit expiry time is given"""
+        if expires_at is None:
+            expires_at = time.time() + self.ttl
+        
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def pop(self, key: str, default: Any = None) -> Any:
+        """Remove entry"""
+        with self._lock:
+            item = self._data.pop(key, None)
+        return default if item is None else item[1]
+    
+    def clear(self) -> None:
+        """Remove all entries"""
+        with self._lock:
+            self._data.clear()
+    
+    def __len__(self) -> int:
+        return len(self._data)
+
 class CacheManager(LoggerMixin):
-    """Cache manager"""
+    """Cache manager backed by a single SQLite database"""
     
     def __init__(self, cache_dir: Optional[Path] = None):
         """Initialize cache manager
@@ -24,50 +133,136 @@ class CacheManager(LoggerMixin):
         
         self.cache_dir = cache_dir
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.db_path = self.cache_dir / Config.CACHE_DB_NAME
         
-        # Cache subdirectories
-        self.paper_cache_dir = self.cache_dir / 'papers'
-        self.search_cache_dir = self.cache_dir / 'searches'
-        
-        self.paper_cache_dir.mkdir(exist_ok=True)
-        self.search_cache_dir.mkdir(exist_ok=True)
+        # Shared by callers on several threads, e.g. concurrent page fetches
+        self._lock = threading.Lock()
+        # Hot entries are served from memory before touching the database
+        self._memory = {
+            'papers': TTLCache(Config.MEMORY_CACHE_SIZE, Config.PAPER_CACHE_TTL),
+            'searches': TTLCache(Config.MEMORY_CACHE_SIZE, Config.SEARCH_CACHE_TTL),
+            'responses': TTLCache(Config.MEMORY_CACHE_SIZE, Config.RESPONSE_CACHE_TTL)
+        }
+        # Writes are buffered and flushed together once Config.CACHE_FLUSH_BYTES
+        # of payload is pending, on close, or at interpreter exit
+        self._pending: Dict[Tuple[str, str], Tuple[int, bytes]] = {}
+        self._pending_bytes = 0
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._init_db()
+        self._finalizer = weakref.finalize(
+            self, _close_connection, self._conn, self._lock, self._pending
+        )
         
-        self.log_info(f"Cache manager initialized, cache directory: {self.cache_dir}")
+        self.log_info("Cache manager initialized, cache database: %s", self.db_path)
     
-    def get_paper_info(self, paper_id: str) -> Optional[Dict[str, Any]]:
-        """Get paper information from cache
+    def _init_db(self) -> None:
+        """Configure the connection and create tables"""
+        with self._lock, self._conn:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+            for table in _TABLES:
+                self._conn.execute(
+                    f'CREATE TABLE IF NOT EXISTS {table} '
+                    f'(id TEXT PRIMARY KEY, cached_at INTEGER NOT NULL, payload BLOB NOT NULL)'
+                )
+                self._conn.execute(
+                    f'CREATE INDEX IF NOT EXISTS {table}_cached_at ON {table} (cached_at)'
+                )
+    
+    def _get(self, table: str, key: str, ttl: int) -> Optional[Any]:
+        """Read and decode a cache entry, deleting it if expired or corrupted
         
         Args:
-            paper_id: Paper ID
+            table: Cache table name
+            key: Entry key
+            ttl: Entry lifetime in seconds
         
         Returns:
-            Paper information dictionary, None if not exists
+            Decoded payload, None if not exists
         """
-        cache_file = self.paper_cache_dir / f"{paper_id}.json"
+        # Memory holds the encoded payload, so every hit decodes fresh objects
+        # that callers can modify without changing the cache
+        data = self._memory[table].get(key)
+        if data is not None:
+            return _loads(data)
+        
+        with self._lock:
+            row = self._pending.get((table, key))
+            if row is None:
+                row = self._conn.execute(
+                    f'SELECT cached_at, payload FROM {table} WHERE id = ?', (key,)
+                ).fetchone()
         
-        if not cache_file.exists():
+        if row is None:
+            return None
+        
+        cached_at, payload = row
+        if time.time() - cached_at > ttl:
+            self.log_debug("Cache entry expired: %s/%s", table, key)
+            self._delete(table, key)
             return None
         
         try:
-            with open(cache_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            # Check if cache is expired (7 days)
-            cached_time = datetime.fromisoformat(data.get('cached_at', '1970-01-01'))
-            if datetime.now() - cached_time > timedelta(days=7):
-                self.log_debug(f"Paper {paper_id} cache expired")
-                cache_file.unlink()
-                return None
-            
-            self.log_debug(f"Retrieved paper info from cache: {paper_id}")
-            return data.get('paper_info')
-            
-        except (json.JSONDecodeError, KeyError, ValueError) as e:
-            self.log_warning(f"Failed to read paper cache {paper_id}: {e}")
-            # Delete corrupted cache file
-            if cache_file.exists():
-                cache_file.unlink()
+            data = zlib.decompress(payload)
+            value = _loads(data)
+        except (zlib.error, ValueError) as e:
+            self.log_warning("Failed to read cache entry %s/%s: %s", table, key, e)
+            self._delete(table, key)
             return None
+        
+        self._memory[table].set(key, data, expires_at=cached_at + ttl)
+        return value
+    
+    def _put(self, table: str, key: str, value: Any) -> None:
+        """Encode and store a cache entry
+        
+        Args:
+            table: Cache table name
+            key: Entry key
+            value: JSON serializable payload
+        """
+        data = _dumps(value)
+        payload = zlib.compress(data)
+        with self._lock:
+            previous = self._pending.get((table, key))
+            if previous is not None:
+                self._pending_bytes -= len(previous[1])
+            self._pending[(table, key)] = (int(time.time()), payload)
+            self._pending_bytes += len(payload)
+            flush_needed = self._pending_bytes >= Config.CACHE_FLUSH_BYTES
+        
+        self._memory[table].set(key, data)
+        if flush_needed:
+            self.flush()
+    
+    def flush(self) -> None:
+        """Write all buffered cache entries to the database"""
+        with self._lock:
+            _flush_pending(self._conn, self._pending)
+            self._pending_bytes = 0
+    
+    def _delete(self, table: str, key: str) -> None:
+        """Delete a cache entry"""
+        self._memory[table].pop(key)
+        with self._lock, self._conn:
+            previous = self._pending.pop((table, key), None)
+            if previous is not None:
+                self._pending_bytes -= len(previous[1])
+            self._conn.execute(f'DELETE FROM {table} WHERE id = ?', (key,))
+    
+    def get_paper_info(self, paper_id: str) -> Optional[Dict[str, Any]]:
+        """Get paper information from cache
+        
+        Args:
+            paper_id: Paper ID
+        
+        Returns:
+            Paper information dictionary, None if not exists
+        """
+        paper_info = self._get('papers', paper_id, Config.PAPER_CACHE_TTL)
+        if paper_info is not None:
+            self.log_debug("Retrieved paper info from cache: %s", paper_id)
+        return paper_info
     
     def save_paper_info(self, paper_id: str, paper_info: Dict[str, Any]) -> None:
         """Save paper information to cache
@@ -76,21 +271,11 @@ class CacheManager(LoggerMixin):
             paper_id: Paper ID
             paper_info: Paper information dictionary
         """
-        cache_file = self.paper_cache_dir / f"{paper_id}.json"
-        
         try:
-            cache_data = {
-                'paper_info': paper_info,
-                'cached_at': datetime.now().isoformat()
-            }
-            
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, ensure_ascii=False, indent=2)
-            
-            self.log_debug(f"Paper info cached: {paper_id}")
-            
+            self._put('papers', paper_id, paper_info)
+            self.log_debug("Paper info cached: %s", paper_id)
         except Exception as e:
-            self.log_warning(f"Failed to save paper cache {paper_id}: {e}")
+            self.log_warning("Failed to save paper cache %s: %s", paper_id, e)
     
     def get_search_results(self, query_hash: str) -> Optional[list]:
         """Get search results from cache
@@ -101,30 +286,10 @@ class CacheManager(LoggerMixin):
         Returns:
             Search results list, None if not exists
         """
-        cache_file = self.search_cache_dir / f"{query_hash}.json"
-        
-        if not cache_file.exists():
-            return None
-        
-        try:
-            with open(cache_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            # Check if cache is expired (1 hour)
-            cached_time = datetime.fromisoformat(data.get('cached_at', '1970-01-01'))
-            if datetime.now() - cached_time > timedelta(hours=1):
-                self.log_debug(f"Search results cache expired: {query_hash}")
-                cache_file.unlink()
-                return None
-            
-            self.log_debug(f"Retrieved search results from cache: {query_hash}")
-            return data.get('results', [])
-            
-        except (json.JSONDecodeError, KeyError, ValueError) as e:
-            self.log_warning(f"Failed to read search cache {query_hash}: {e}")
-            if cache_file.exists():
-                cache_file.unlink()
-            return None
+        results = self._get('searches', query_hash, Config.SEARCH_CACHE_TTL)
+        if results is not None:
+            self.log_debug("Retrieved search results from cache: %s", query_hash)
+        return results
     
     def save_search_results(self, query_hash: str, results: list) -> None:
         """Save search results to cache
@@ -133,67 +298,115 @@ class CacheManager(LoggerMixin):
             query_hash: Query hash value
             results: Search results list
         """
-        cache_file = self.search_cache_dir / f"{query_hash}.json"
+        try:
+            self._put('searches', query_hash, results)
+            self.log_debug("Search results cached: %s", query_hash)
+        except Exception as e:
+            self.log_warning("Failed to save search cache %s: %s", query_hash, e)
+    
+    def get_response(self, request_key: str) -> Optional[str]:
+        """Get raw API response from cache
+        
+        Args:
+            request_key: Hash of the request parameters
+        
+        Returns:
+            Response body, None if not exists
+        """
+        response = self._get('responses', request_key, Config.RESPONSE_CACHE_TTL)
+        if response is not None:
+            self.log_debug("Retrieved API response from cache: %s", request_key)
+        return response
+    
+    def save_response(self, request_key: str, response_text: str) -> None:
+        """Save raw API response to cache
         
+        Args:
+            request_key: Hash of the request parameters
+            response_text: Response body
+        """
         try:
-            cache_data = {
-                'results': results,
-                'cached_at': datetime.now().isoformat()
-            }
-            
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, ensure_ascii=False, indent=2)
-            
-            self.log_debug(f"Search results cached: {query_hash}")
-            
+            self._put('responses', request_key, response_text)
+            self.log_debug("API response cached: %s", request_key)
         except Exception as e:
-            self.log_warning(f"Failed to save search cache {query_hash}: {e}")
+            self.log_warning("Failed to save response cache %s: %s", request_key, e)
     
     def clear_expired_cache(self) -> None:
         """Clear expired cache"""
         self.log_info("Starting to clear expired cache")
         
-        # Clear paper cache (7 days)
-        paper_count = 0
-        for cache_file in self.paper_cache_dir.glob('*.json'):
-            try:
-                with open(cache_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                
-                cached_time = datetime.fromisoformat(data.get('cached_at', '1970-01-01'))
-                if datetime.now() - cached_time > timedelta(days=7):
-                    cache_file.unlink()
-                    paper_count += 1
-                    
-            except Exception:
-                # Delete corrupted cache files
-                cache_file.unlink()
-                paper_count += 1
-        
-        # Clear search cache (1 hour)
-        search_count = 0
-        for cache_file in self.search_cache_dir.glob('*.json'):
-            try:
-                with open(cache_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                
-                cached_time = datetime.fromisoformat(data.get('cached_at', '1970-01-01'))
-                if datetime.now() - cached_time > timedelta(hours=1):
-                    cache_file.unlink()
-                    search_count += 1
-                    
-            except Exception:
-                cache_file.unlink()
-                search_count += 1
-        
-        self.log_info(f"Cache cleanup completed, deleted paper cache: {paper_count}, search cache: {search_count}")
+        self.flush()
+        now = int(time.time())
+        with self._lock, self._conn:
+            paper_count = self._conn.execute(
+                'DELETE FROM papers WHERE cached_at < ?', (now - Config.PAPER_CACHE_TTL,)
+            ).rowcount
+            search_count = self._conn.execute(
+                'DELETE FROM searches WHERE cached_at < ?', (now - Config.SEARCH_CACHE_TTL,)
+            ).rowcount
+            response_count = self._conn.execute(
+                'DELETE FROM responses WHERE cached_at < ?', (now - Config.RESPONSE_CACHE_TTL,)
+            ).rowcount
+        
+        legacy_count = self._clear_legacy_cache(now)
+        
+        self.log_info(
+            "Cache cleanup completed, deleted paper cache: %d, search cache: %d, "
+            "response cache: %d, legacy files: %d",
+            paper_count, search_count, response_count, legacy_count
+        )
+    
+    def _clear_legacy_cache(self, now: float) -> int:
+        """Delete expired per-file JSON cache entries left by earlier versions
+        
+        Expiry is judged from the file mtime (set when the entry was written),
+        so files are never opened.
+        
+        Args:
+            now: Current timestamp
+        
+        Returns:
+            Number of deleted files
+        """
+        count = 0
+        for subdir, ttl in _LEGACY_DIRS.items():
+            legacy_dir = self.cache_dir / subdir
+            if not legacy_dir.is_dir():
+                continue
+            
+            with os.scandir(legacy_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith('.json') or not entry.is_file():
+                        continue
+                    try:
+                        if now - entry.stat().st_mtime > ttl:
+                            os.unlink(entry.path)
+                            count += 1
+                    except OSError as e:
+                        self.log_warning("Failed to remove legacy cache file %s: %s", entry.path, e)
+        
+        return count
     
     def get_cache_stats(self) -> Dict[str, int]:
         """Get cache statistics"""
-        paper_count = len(list(self.paper_cache_dir.glob('*.json')))
-        search_count = len(list(self.search_cache_dir.glob('*.json')))
+        self.flush()
+        with self._lock:
+            paper_count = self._conn.execute('SELECT COUNT(*) FROM papers').fetchone()[0]
+            search_count = self._conn.execute('SELECT COUNT(*) FROM searches').fetchone()[0]
+            response_count = self._conn.execute('SELECT COUNT(*) FROM responses').fetchone()[0]
         
         return {
             'paper_cache_count': paper_count,
-            'search_cache_count': search_count
-        }
\ No newline at end of file
+            'search_cache_count': search_count,
+            'response_cache_count': response_count
+        }
+    
+    def close(self) -> None:
+        """Flush buffered entries and close the cache database"""
+        self._finalizer()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
\ No newline at end of file
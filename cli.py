@@ -7,15 +7,57 @@ Provides friendly command line interaction experience
 
 import argparse
 import asyncio
+import functools
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, Tuple
 
 from arxiv_downloader import ArxivDownloader
-from async_downloader import AsyncArxivDownloader, download_papers_async
+from async_downloader import AsyncArxivDownloader, use_uvloop
+from enhanced_arxiv_api import EnhancedArxivAPI, DateRange
 from plugins import create_default_plugins, CategoryFilterPlugin
 from config import Config
-from logger import setup_logging
+from logger import setup_logging, get_logger
+from utils import scan_downloaded_ids
+
+# Command line arguments as (flags, add_argument keyword arguments)
+ARGS = [
+    # Basic parameters
+    (("--query", "-q"), dict(
+        default=Config.DEFAULT_QUERY,
+        help=f"Search query (default: {Config.DEFAULT_QUERY})")),
+    (("--max-results", "-n"), dict(
+        type=int, default=Config.DEFAULT_MAX_RESULTS,
+        help=f"Maximum download count (default: {Config.DEFAULT_MAX_RESULTS})")),
+    (("--download-dir", "-d"), dict(
+        type=str,
+        help=f"Download directory (default: {Config.DEFAULT_DOWNLOAD_DIR})")),
+    # Date range
+    (("--date-from",), dict(type=str, help="Start date (format: YYYY-MM-DD)")),
+    (("--date-to",), dict(type=str, help="End date (format: YYYY-MM-DD)")),
+    # Category filtering
+    (("--categories",), dict(
+        type=str, help="Allowed categories, comma-separated (e.g.: cs.AI,cs.LG)")),
+    (("--exclude-categories",), dict(
+        type=str, help="Excluded categories, comma-separated (e.g.: cs.CV,cs.RO)")),
+    # Performance options
+    (("--async",), dict(action="store_true", dest="use_async", help="Use async download (faster)")),
+    (("--max-concurrent",), dict(
+        type=int, default=Config.MAX_CONCURRENT_DOWNLOADS,
+        help=f"Maximum concurrent PDF downloads (default: {Config.MAX_CONCURRENT_DOWNLOADS})")),
+    # Plugin options
+    (("--no-plugins",), dict(action="store_true", help="Disable all plugins")),
+    (("--no-duplicate-check",), dict(action="store_true", help="Disable duplicate check")),
+    (("--no-metadata",), dict(action="store_true", help="Do not save metadata")),
+    # Logging options
+    (("--verbose", "-v"), dict(action="store_true", help="Verbose output")),
+    (("--quiet",), dict(action="store_true", help="Quiet mode")),
+    # Other options
+    (("--dry-run",), dict(action="store_true", help="Search only, do not download")),
+    (("--version",), dict(action="version", version="ArXiv Downloader 1.0.0")),
+]
 
 def create_parser() -> argparse.ArgumentParser:
     """Create command line argument parser"""
@@ -31,110 +73,8 @@ Example usage:
         """
     )
     
-    # Basic parameters
-    parser.add_argument(
-        "--query", "-q",
-        default=Config.DEFAULT_QUERY,
-        help=f"Search query (default: {Config.DEFAULT_QUERY})"
-    )
-    
-    parser.add_argument(
-        "--max-results", "-n",
-        type=int,
-        default=Config.DEFAULT_MAX_RESULTS,
-        help=f"Maximum download count (default: {Config.DEFAULT_MAX_RESULTS})"
-    )
-    
-    parser.add_argument(
-        "--download-dir", "-d",
-        type=str,
-        help=f"Download directory (default: {Config.DEFAULT_DOWNLOAD_DIR})"
-    )
-    
-    # Date range
-    parser.add_argument(
-        "--date-from",
-        type=str,
-        help="Start date (format: YYYY-MM-DD)"
-    )
-    
-    parser.add_argument(
-        "--date-to",
-        type=str,
-        help="End date (format: YYYY-MM-DD)"
-    )
-    
-    # Category filtering
-    parser.add_argument(
-        "--categories",
-        type=str,
-        help="Allowed categories, comma-separated (e.g.: cs.AI,cs.LG)"
-    )
-    
-    parser.add_argument(
-        "--exclude-categories",
-        type=str,
-        help="Excluded categories, comma-separated (e.g.: cs.CV,cs.RO)"
-    )
-    
-    # Performance options
-    parser.add_argument(
-        "--async",
-        action="store_true",
-        help="Use async download (faster)"
-    )
-    
-    parser.add_argument(
-        "--max-concurrent",
-        type=int,
-        default=Config.MAX_CONCURRENT_DOWNLOADS,
-        help=f"Maximum concurrent downloads (default: {Config.MAX_CONCURRENT_DOWNLOADS})"
-    )
-    
-    # Plugin options
-    parser.add_argument(
-        "--no-plugins",
-        action="store_true",
-        help="Disable all plugins"
-    )
-    
-    parser.add_argument(
-        "--no-duplicate-check",
-        action="store_true",
-        help="Disable duplicate check"
-    )
-    
-    parser.add_argument(
-        "--no-metadata",
-        action="store_true",
-        help="Do not save metadata"
-    )
-    
-    # Logging options
-    parser.add_argument(
-        "--verbose", "-v",
-        action="store_true",
-        help="Verbose output"
-    )
-    
-    parser.add_argument(
-        "--quiet",
-        action="store_true",
-        help="Quiet mode"
-    )
-    
-    # Other options
-    parser.add_argument(
-        "--dry-run",
-        action="store_true",
-        help="Search only, do not download"
-    )
-    
-    parser.add_argument(
-        "--version",
-        action="version",
-        version="ArXiv Downloader 1.0.0"
-    )
+    for flags, kwargs in ARGS:
+        parser.add_argument(*flags, **kwargs)
     
     return parser
 
@@ -153,11 +93,35 @@ def setup_logging_from_args(args) -> None:
         console_output=not args.quiet
     )
 
-def parse_categories(categories_str: Optional[str]) -> List[str]:
-    """Parse category string"""
+# Per-paper progress goes through logging, so --quiet silences it
+logger = get_logger('arxiv_downloader.cli')
+
+# Answers accepted as confirmation
+_YES = frozenset({'y', 'yes'})
+
+@functools.lru_cache(maxsize=16)
+def parse_categories(categories_str: Optional[str]) -> Tuple[str, ...]:
+    """Parse category string (cached, returns an immutable tuple)"""
     if not categories_str:
-        return []
-    return [cat.strip() for cat in categories_str.split(',') if cat.strip()]
+        return ()
+    return tuple(cat.strip() for cat in categories_str.split(',') if cat.strip())
+
+def create_category_filter(args) -> Optional[CategoryFilterPlugin]:
+    """Create category filter from command line arguments, None if no categories given"""
+    allowed_categories = parse_categories(args.categories)
+    excluded_categories = parse_categories(args.exclude_categories)
+    
+    if not (allowed_categories or excluded_categories):
+        return None
+    
+    return CategoryFilterPlugin(
+        allowed_categories=allowed_categories,
+        blocked_categories=excluded_categories
+    )
+
+def _to_export(url: str) -> str:
+    """Point an arxiv.org URL at the export.arxiv.org mirror meant for bulk access"""
+    return url.replace("://arxiv.org/", "://export.arxiv.org/", 1)
 
 def print_search_results(papers, dry_run=False):
     """Print search results"""
@@ -165,18 +129,68 @@ def print_search_results(papers, dry_run=False):
         print("No papers found matching the criteria")
         return
     
-    print(f"\nFound {len(papers)} papers:")
-    print("-" * 80)
+    # Build the listing first and write it once instead of one print per line
+    lines = ["", f"Found {len(papers)} papers:", "-" * 80]
     
     for i, paper in enumerate(papers, 1):
-        print(f"{i:2d}. {paper.id} - {paper.title[:60]}...")
-        print(f"    Authors: {', '.join(paper.authors[:3])}{'...' if len(paper.authors) > 3 else ''}")
-        print(f"    Categories: {', '.join(paper.categories)}")
-        print(f"    Published: {paper.published}")
-        print()
+        lines.append(f"{i:2d}. {paper.id} - {paper.title[:60]}...")
+        lines.append(f"    Authors: {', '.join(paper.authors[:3])}{'...' if len(paper.authors) > 3 else ''}")
+        lines.append(f"    Categories: {', '.join(paper.categories)}")
+        lines.append(f"    Published: {paper.published}")
+        lines.append("")
     
     if dry_run:
-        print("[Dry run mode] No actual download performed")
+        lines.append("[Dry run mode] No actual download performed")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+async def ainput(prompt: str) -> str:
+    """Read a line from stdin without blocking the event loop
+    
+    Uses a daemon thread so an interrupted prompt cannot keep the process alive.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    
+    def settle(setter, value):
+        if not future.done():
+            setter(value)
+    
+    def read():
+        try:
+            line = input(prompt)
+        except BaseException as e:
+            callback = (settle, future.set_exception, e)
+        else:
+            callback = (settle, future.set_result, line)
+        try:
+            loop.call_soon_threadsafe(*callback)
+        except RuntimeError:
+            pass  # event loop already closed
+    
+    threading.Thread(target=read, daemon=True).start()
+    return await future
+
+async def confirm_and_download_async(papers, args) -> Optional[dict]:
+    """Confirm and run an async download, warming up connections during the prompt
+    
+    Returns:
+        Download result statistics, None if the user cancelled
+    """
+    async with AsyncArxivDownloader(args.download_dir, args.max_concurrent) as downloader:
+        # The session, DNS lookup and TLS handshake complete while the user reads
+        prewarm = asyncio.ensure_future(downloader.prewarm(papers[0].pdf_url))
+        
+        if not args.quiet:
+            response = await ainput(f"\nDownload these {len(papers)} papers? [y/N]: ")
+            if response.lower() not in _YES:
+                prewarm.cancel()
+                return None
+        
+        await prewarm
+        print(f"\nStarting download to: {downloader.download_dir}")
+        return await downloader.download_papers_async(papers)
 
 def main():
     """Main function"""
@@ -194,8 +208,7 @@ def main():
         print(f"Searching papers: {args.query}")
         if args.date_from or args.date_to:
             print(f"Date range: {args.date_from or 'unlimited'} to {args.date_to or 'unlimited'}")
-      # Search papers using enhanced API
-        from enhanced_arxiv_api import DateRange
+        # Search papers using enhanced API
         date_range = None
         if args.date_from or args.date_to:
             date_range = DateRange(
@@ -203,26 +216,33 @@ def main():
                 end_date=args.date_to
             )
         
-        papers = downloader.search_papers_enhanced(
-            query=args.query,
-            date_range=date_range,
-            max_results=args.max_results
-        )
+        with EnhancedArxivAPI() as api:
+            if args.max_results > Config.SEARCH_PAGE_SIZE:
+                # Fetch result pages concurrently instead of one after another
+                papers = asyncio.run(api.search_papers_async(
+                    query=args.query,
+                    date_range=date_range,
+                    max_results=args.max_results
+                ))
+            else:
+                papers = api.search_papers(
+                    query=args.query,
+                    date_range=date_range,
+                    max_results=args.max_results
+                )
         
-        # Setup plugins
+        # Category filtering is cheap and also applies to dry runs
         if not args.no_plugins:
-            plugin_manager = create_default_plugins(downloader.download_dir)
-            
-            # Category filter plugin
-            allowed_categories = parse_categories(args.categories)
-            excluded_categories = parse_categories(args.exclude_categories)
-            
-            if allowed_categories or excluded_categories:
-                category_filter = CategoryFilterPlugin(
-                    allowed_categories=allowed_categories,
-                    blocked_categories=excluded_categories
-                )
-                plugin_manager.register_plugin(category_filter)
+            category_filter = create_category_filter(args)
+            if category_filter is not None:
+                papers = [paper for paper in papers if category_filter.pre_download(paper)]
+        
+        # Setup plugins only when something will be downloaded, their
+        # initialization reads the download directory
+        if not args.dry_run and papers and not args.no_plugins:
+            # Read the download directory once for the duplicate check
+            existing_ids = scan_downloaded_ids(downloader.download_dir)
+            plugin_manager = create_default_plugins(downloader.download_dir, existing_ids)
             
             # Disable specific plugins
             if args.no_duplicate_check:
@@ -236,12 +256,11 @@ def main():
                     metadata_plugin.disable()
             
             # Apply plugin filtering
-            filtered_papers = []
-            for paper in papers:
-                if plugin_manager.pre_download_hook(paper):
-                    filtered_papers.append(paper)
-            
-            papers = filtered_papers
+            papers = [paper for paper in papers if plugin_manager.pre_download_hook(paper)]
+        
+        # Bulk downloads are throttled on arxiv.org, fetch PDFs from the export mirror
+        for paper in papers:
+            paper.pdf_url = _to_export(paper.pdf_url)
         
         # Display search results
         print_search_results(papers, args.dry_run)
@@ -249,25 +268,13 @@ def main():
         if args.dry_run or not papers:
             return
         
-        # Confirm download
-        if not args.quiet:
-            response = input(f"\nDownload these {len(papers)} papers? [y/N]: ")
-            if response.lower() not in ['y', 'yes']:
+        if args.use_async:
+            # Async download
+            use_uvloop()
+            result = asyncio.run(confirm_and_download_async(papers, args))
+            if result is None:
                 print("Download cancelled")
                 return
-        
-        # Execute download
-        print(f"\nStarting download to: {downloader.download_dir}")
-        
-        if getattr(args, 'async'):
-            # Async download
-            result = asyncio.run(
-                download_papers_async(
-                    papers, 
-                    args.download_dir, 
-                    args.max_concurrent
-                )
-            )
             
             print(f"\nDownload completed!")
             print(f"Successful: {result['successful']}")
@@ -275,33 +282,48 @@ def main():
             print(f"Skipped: {result['skipped']}")
             print(f"Time taken: {result['total_time']:.2f} seconds")
         else:
+            # Confirm download
+            if not args.quiet:
+                response = input(f"\nDownload these {len(papers)} papers? [y/N]: ")
+                if response.lower() not in _YES:
+                    print("Download cancelled")
+                    return
+            
             # Sync download
+            print(f"\nStarting download to: {downloader.download_dir}")
             successful = 0
             failed = 0
+            total = len(papers)
             
-            for i, paper in enumerate(papers, 1):
-                print(f"[{i}/{len(papers)}] Downloading: {paper.title[:50]}...")
+            # Downloads are network bound, so threads overlap them; plugin hooks
+            # and counters stay on the main thread as results come in
+            with ThreadPoolExecutor(max_workers=args.max_concurrent) as pool:
+                futures = {pool.submit(downloader.download_pdf, paper): paper for paper in papers}
                 
-                try:
-                    if downloader.download_pdf(paper.pdf_url, paper.title, paper.id):
-                        successful += 1
-                        if not args.no_plugins:
-                            plugin_manager.post_download_hook(
-                                paper, 
-                                downloader.download_dir / f"{paper.id}_{paper.title[:50]}.pdf",
-                                True
-                            )
-                    else:
+                for i, future in enumerate(as_completed(futures), 1):
+                    paper = futures[future]
+                    try:
+                        if future.result():
+                            successful += 1
+                            logger.info("[%d/%d] Downloaded: %.50s...", i, total, paper.title)
+                            if not args.no_plugins:
+                                plugin_manager.post_download_hook(
+                                    paper, 
+                                    downloader.paper_filepath(paper),
+                                    True
+                                )
+                        else:
+                            failed += 1
+                            logger.info("[%d/%d] Failed: %.50s...", i, total, paper.title)
+                            if not args.no_plugins:
+                                plugin_manager.post_download_hook(
+                                    paper, 
+                                    Path(""),
+                                    False
+                                )
+                    except Exception as e:
+                        print(f"Download failed: {str(e)}")
                         failed += 1
-                        if not args.no_plugins:
-                            plugin_manager.post_download_hook(
-                                paper, 
-                                Path(""),
-                                False
-                            )
-                except Exception as e:
-                    print(f"Download failed: {str(e)}")
-                    failed += 1
             
             print(f"\nDownload completed! Successful: {successful}, Failed: {failed}")
     
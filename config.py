@@ -1,5 +1,6 @@
 """Configuration management module"""
 
+import re
 from pathlib import Path
 
 class Config:
@@ -9,6 +10,9 @@ class Config:
     DEFAULT_DOWNLOAD_DIR = "./arxiv_papers"
     DEFAULT_QUERY = "cat:cs.AI"
     DEFAULT_MAX_RESULTS = 10
+    ID_BATCH_SIZE = 200  # paper IDs resolved per API request
+    SEARCH_PAGE_SIZE = 200  # results per API request when paging large searches
+    SEARCH_PAGE_CONCURRENCY = 3  # search pages fetched at once
     
     # File processing configuration
     MAX_FILENAME_LENGTH = 100
@@ -16,17 +20,43 @@ class Config:
     API_TIMEOUT = 30   # seconds
     DOWNLOAD_TIMEOUT = 60  # seconds
     CHUNK_SIZE = 8192
+    ASYNC_CHUNK_SIZE = 64 * 1024  # streamed async download chunk
+    WRITE_BUFFER_SIZE = 1024 * 1024  # coalesce chunk writes into 1MB syscalls
+    LOCAL_MIRROR_PATH = None  # directory of <paper_id>.pdf files copied instead of downloaded
+    MAX_PDF_BYTES = 200 * 1024 * 1024  # skip PDFs reported larger than this
+    MIN_PDF_BYTES = 1024  # anything smaller is an error page, not a PDF
+    DROP_PAGE_CACHE = True  # drop written PDFs from the OS page cache (Linux)
     
     # Filename cleaning rules
     INVALID_CHARS_PATTERN = r'[<>:"/\\|?*]'
     WHITESPACE_PATTERN = r'\s+'
+    INVALID_CHARS_RE = re.compile(INVALID_CHARS_PATTERN)  # compiled once, used per title
+    WHITESPACE_RE = re.compile(WHITESPACE_PATTERN)
+    
+    # Cache configuration
+    CACHE_DB_NAME = 'cache.db'
+    PAPER_CACHE_TTL = 7 * 24 * 3600  # seconds
+    SEARCH_CACHE_TTL = 3600  # seconds
+    RESPONSE_CACHE_TTL = 3600  # seconds, raw API responses keyed by request parameters
+    MEMORY_CACHE_SIZE = 1024  # entries per table kept in memory
+    SEARCH_RESULTS_CACHE_SIZE = 128  # parsed search results kept per API client
+    CACHE_FLUSH_BYTES = 256 * 1024  # buffered compressed payload before a batched write
     
     # Retry configuration
     MAX_RETRIES = 3
     RETRY_DELAY_BASE = 2  # exponential backoff base
+    RETRY_MAX_DELAY = 30  # seconds, cap on a single backoff wait
+    RETRY_JITTER = 0.5  # up to +50% random spread on each wait
     
     # Concurrency configuration
     MAX_CONCURRENT_DOWNLOADS = 5
+    MAX_CONNECTIONS_PER_HOST = 10  # arxiv answers more parallel connections with 429s
+    DNS_CACHE_TTL = 300  # seconds
+    KEEPALIVE_TIMEOUT = 30  # seconds an idle pooled connection is kept open
+    HTTP_POOL_CONNECTIONS = 10  # per-host connection pools kept by a requests session
+    HTTP_POOL_MAXSIZE = 20  # connections kept per pool
+    RATE_LIMIT_REQUESTS = 1  # export API requests allowed per RATE_LIMIT_PERIOD (arxiv asks for 1 per 3s)
+    RATE_LIMIT_PERIOD = 3.0  # seconds
     
     # Logging configuration
     LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
@@ -2,31 +2,33 @@
 
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from arxiv_downloader import ArxivDownloader
-import requests
-import xml.etree.ElementTree as ET
+from arxiv_parser import iter_entries
+from debug_parsing import ID_QUERY
+from logger import get_logger
+from utils import create_http_session
+
+logger = get_logger('arxiv_downloader.debug')
+
+_SESSION = create_http_session(max_retries=3)
 
 def test_direct_api():
     """Test direct API call"""
     print("=== Testing Direct API Call ===")
     
-    params = {
-        'search_query': 'id:1811.04422',
-        'start': 0,
-        'max_results': 1
-    }
-    
-    response = requests.get('http://export.arxiv.org/api/query', params=params, timeout=30)
+    response = _SESSION.send(ID_QUERY, timeout=30, stream=True)
     print(f"Status: {response.status_code}")
-    print(f"Content length: {len(response.text)}")
+    print(f"Content length: {response.headers.get('Content-Length', 'unknown')}")
     
     if response.status_code == 200:
-        root = ET.fromstring(response.text)
-        entries = root.findall('.//{http://www.w3.org/2005/Atom}entry')
-        print(f"Found {len(entries)} entries")
-        return len(entries) > 0
+        # Count entries while streaming instead of building the whole tree
+        response.raw.decode_content = True
+        entry_count = sum(1 for _ in iter_entries(response.raw))
+        print(f"Found {entry_count} entries")
+        return entry_count > 0
     return False
 
 def test_arxiv_downloader():
@@ -52,8 +54,7 @@ def test_arxiv_downloader():
         
     except Exception as e:
         print(f"Error in ArxivDownloader: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception('Traceback')
         return False
 
 def test_build_search_query():
@@ -75,8 +76,7 @@ def test_build_search_query():
         
     except Exception as e:
         print(f"Error building query: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception('Traceback')
         return False
 
 def test_request_with_retry():
@@ -89,9 +89,7 @@ def test_request_with_retry():
         params = {
             'search_query': 'id:1811.04422',
             'start': 0,
-            'max_results': 1,
-            'sortBy': 'relevance',
-            'sortOrder': 'descending'
+            'max_results': 1
         }
         
         print(f"Making request to: {downloader.base_url}")
@@ -105,8 +103,7 @@ def test_request_with_retry():
         
     except Exception as e:
         print(f"Error in request: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception('Traceback')
         return False
 
 def main():
@@ -120,17 +117,23 @@ def main():
         ("ArxivDownloader", test_arxiv_downloader),
     ]
     
-    results = []
-    for test_name, test_func in tests:
-        try:
-            result = test_func()
-            results.append((test_name, result))
-            print(f"\n{test_name}: {'PASS' if result else 'FAIL'}")
-        except Exception as e:
-            results.append((test_name, False))
-            print(f"\n{test_name}: FAIL - {e}")
-        
-        print("-" * 50)
+    # Each test waits on the network, so run them side by side; their
+    # progress output may interleave
+    outcomes = {}
+    with ThreadPoolExecutor(max_workers=len(tests)) as pool:
+        futures = {pool.submit(test_func): test_name for test_name, test_func in tests}
+        for future in as_completed(futures):
+            test_name = futures[future]
+            try:
+                outcomes[test_name] = future.result()
+                print(f"\n{test_name}: {'PASS' if outcomes[test_name] else 'FAIL'}")
+            except Exception as e:
+                outcomes[test_name] = False
+                print(f"\n{test_name}: FAIL - {e}")
+            
+            print("-" * 50)
+    
+    results = [(test_name, outcomes[test_name]) for test_name, _ in tests]
     
     print("\n=== Test Summary ===")
     for test_name, result in results:
@@ -1,70 +1,121 @@
 #!/usr/bin/env python3
 
-import requests
-import xml.etree.ElementTree as ET
 from typing import Dict, List, Optional
 
-def debug_parse_entry(entry, namespaces: Dict[str, str]):
-    """Debug version of _parse_entry method"""
-    print("\n=== Parsing Entry ===")
+import requests
+
+from arxiv_parser import (
+    iter_entries, TITLE_TAG, SUMMARY_TAG, ID_TAG, AUTHOR_TAG, NAME_TAG,
+    CATEGORY_TAG, PUBLISHED_TAG, LINK_TAG
+)
+from logger import get_logger
+from utils import create_http_session
+
+logger = get_logger('arxiv_downloader.debug')
+
+# HTTPS, so the pooled session keeps reusing one TLS connection
+ARXIV_API = 'https://export.arxiv.org/api/query'
+
+_SESSION = create_http_session(max_retries=3)
+
+# The sample paper lookup is encoded once and resent as is
+ID_QUERY = _SESSION.prepare_request(requests.Request(
+    'GET', ARXIV_API,
+    params={'search_query': 'id:1811.04422', 'start': 0, 'max_results': 1}
+))
+
+def _norm(text):
+    """Strip text and collapse whitespace runs in one pass"""
+    return ' '.join(text.split()) if text else ''
+
+def _first(key):
+    """Handler keeping the first element seen for key"""
+    def handle(fields, elem):
+        fields.setdefault(key, elem)
+    return handle
+
+def _add_author(fields, elem):
+    """Collect an author's name"""
+    name_elem = elem.find(NAME_TAG)
+    if name_elem is not None:
+        fields['authors'].append(name_elem.text.strip())
+
+def _add_category(fields, elem):
+    """Collect a category term"""
+    term = elem.get('term')
+    if term:
+        fields['categories'].append(term)
+
+def _add_link(fields, elem):
+    """Collect a link element"""
+    fields['links'].append(elem)
+
+def _skip(fields, elem):
+    """Ignore tags the debug output does not use"""
+
+# Entry child handlers keyed on tag, each taking (fields, element)
+_HANDLERS = {
+    TITLE_TAG: _first('title'),
+    SUMMARY_TAG: _first('summary'),
+    ID_TAG: _first('id'),
+    PUBLISHED_TAG: _first('published'),
+    AUTHOR_TAG: _add_author,
+    CATEGORY_TAG: _add_category,
+    LINK_TAG: _add_link,
+}
+
+def debug_parse_entry(entry, namespaces: Optional[Dict[str, str]] = None,
+                      verbose: bool = False):
+    """Debug version of _parse_entry method
     
+    namespaces is accepted for compatibility; tags are matched in Clark notation.
+    Field by field output is only printed when verbose is set, so the function
+    can also be run over large result sets.
+    """
     try:
-        # Extract basic information
-        title = entry.find('atom:title', namespaces)
-        title_text = title.text.strip().replace('\n', ' ') if title is not None else "Unknown Title"
-        print(f"Title: {title_text}")
+        # One pass over the children, one dict lookup per Clark-notation tag
+        fields = {'authors': [], 'categories': [], 'links': []}
+        for child in entry:
+            _HANDLERS.get(child.tag, _skip)(fields, child)
+        title = fields.get('title')
+        summary = fields.get('summary')
+        id_elem = fields.get('id')
+        published = fields.get('published')
+        authors = fields['authors']
+        categories = fields['categories']
+        links = fields['links']
         
-        summary = entry.find('atom:summary', namespaces)
-        summary_text = summary.text.strip().replace('\n', ' ') if summary is not None else ""
-        print(f"Summary length: {len(summary_text)}")
+        # Extract basic information
+        title_text = _norm(title.text) if title is not None else "Unknown Title"
+        summary_text = _norm(summary.text) if summary is not None else ""
         
         # Extract ArXiv ID from URL
-        id_elem = entry.find('atom:id', namespaces)
         if id_elem is None:
             print("ERROR: No ID element found")
             return None
         
-        arxiv_id = id_elem.text.split('/')[-1]
-        print(f"ArXiv ID: {arxiv_id}")
-        
-        # Extract authors
-        authors = []
-        author_elements = entry.findall('atom:author', namespaces)
-        print(f"Found {len(author_elements)} authors")
-        for author_elem in author_elements:
-            name_elem = author_elem.find('atom:name', namespaces)
-            if name_elem is not None:
-                authors.append(name_elem.text.strip())
-        print(f"Authors: {authors}")
-        
-        # Extract categories
-        categories = []
-        category_elements = entry.findall('atom:category', namespaces)
-        print(f"Found {len(category_elements)} categories")
-        for cat_elem in category_elements:
-            term = cat_elem.get('term')
-            if term:
-                categories.append(term)
-        print(f"Categories: {categories}")
+        id_url = id_elem.text
+        arxiv_id = id_url[id_url.rfind('/') + 1:]
         
         # Extract publication date
-        published = entry.find('atom:published', namespaces)
         published_text = published.text if published is not None else ""
-        print(f"Published: {published_text}")
         
         # Extract PDF URL
-        pdf_url = ""
-        link_elements = entry.findall('atom:link', namespaces)
-        print(f"Found {len(link_elements)} links")
-        for link in link_elements:
-            link_type = link.get('type')
-            href = link.get('href')
-            print(f"  Link: type={link_type}, href={href}")
-            if link.get('type') == 'application/pdf':
-                pdf_url = link.get('href', '')
-                break
+        pdf_url = next((link.get('href', '') for link in links
+                        if link.get('type') == 'application/pdf'), '')
         
-        print(f"PDF URL: {pdf_url}")
+        if verbose:
+            print("\n=== Parsing Entry ===")
+            print(f"Title: {title_text}")
+            print(f"Summary length: {len(summary_text)}")
+            print(f"ArXiv ID: {arxiv_id}")
+            print(f"Authors: {authors}")
+            print(f"Categories: {categories}")
+            print(f"Published: {published_text}")
+            print(f"Found {len(links)} links")
+            for link in links:
+                print(f"  Link: type={link.get('type')}, href={link.get('href')}")
+            print(f"PDF URL: {pdf_url}")
         
         # Create paper data
         paper_data = {
@@ -77,13 +128,13 @@ def debug_parse_entry(entry, namespaces: Dict[str, str]):
             'pdf_url': pdf_url
         }
         
-        print(f"Paper data created successfully: {paper_data['title']}")
+        if verbose:
+            print(f"Paper data created successfully: {paper_data['title']}")
         return paper_data
         
     except Exception as e:
         print(f"ERROR parsing entry: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception('Traceback')
         return None
 
 def test_parsing():
@@ -91,44 +142,29 @@ def test_parsing():
     
     print("Testing ArXiv parsing with paper ID: 1811.04422")
     
-    params = {
-        'search_query': 'id:1811.04422',
-        'start': 0,
-        'max_results': 1
-    }
-    
     try:
-        response = requests.get('http://export.arxiv.org/api/query', params=params, timeout=30)
+        response = _SESSION.send(ID_QUERY, timeout=30, stream=True)
         print(f"Status Code: {response.status_code}")
         
         if response.status_code == 200:
-            # Parse XML
-            root = ET.fromstring(response.text)
-            
-            # Define namespaces
-            namespaces = {
-                'atom': 'http://www.w3.org/2005/Atom',
-                'arxiv': 'http://arxiv.org/schemas/atom'
-            }
-            
-            entries = root.findall('atom:entry', namespaces)
-            print(f"Found {len(entries)} entries")
-            
-            for i, entry in enumerate(entries):
-                print(f"\n--- Entry {i+1} ---")
-                paper_data = debug_parse_entry(entry, namespaces)
+            # Parse XML incrementally straight from the socket
+            response.raw.decode_content = True
+            count = 0
+            for count, entry in enumerate(iter_entries(response.raw), 1):
+                print(f"\n--- Entry {count} ---")
+                paper_data = debug_parse_entry(entry, verbose=True)
                 if paper_data:
                     print("SUCCESS: Paper parsed successfully")
                 else:
                     print("FAILED: Could not parse paper")
+            print(f"Found {count} entries")
                     
         else:
             print(f"Request failed with status {response.status_code}")
             
     except Exception as e:
         print(f"Test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception('Traceback')
 
 if __name__ == "__main__":
     test_parsing()
\ No newline at end of file
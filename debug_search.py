@@ -36,7 +36,8 @@ def test_search_queries():
     print("\n=== Comparing Results ===")
     if 'papers1' in locals() and 'papers2' in locals():
         if len(papers1) > 0 and len(papers2) > 0:
-            same_titles = [p1.title for p1 in papers1 if p1.title in [p2.title for p2 in papers2]]
+            titles2 = {p2.title for p2 in papers2}
+            same_titles = [p1.title for p1 in papers1 if p1.title in titles2]
             print(f"Identical papers found: {len(same_titles)}")
             if same_titles:
                 print("Identical titles:")
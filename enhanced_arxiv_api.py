@@ -8,17 +8,60 @@ It includes comprehensive query syntax support, proper parameter validation, and
 Reference: https://info.arxiv.org/help/api/user-manual.html
 """
 
+import asyncio
+import aiohttp
+import atexit
+import functools
+import hashlib
+import io
+import re
 import requests
+import urllib3
 import xml.etree.ElementTree as ET
-import time
-from typing import Dict, List, Optional, Any, Union
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Any, Sequence, Tuple, Union
 from urllib.parse import urlencode
 from dataclasses import dataclass
 from enum import Enum
 
-from models import Paper, NetworkError, ValidationError, ParseError
+from models import Paper, NetworkError, ValidationError, ParseError, DATACLASS_SLOTS
 from logger import LoggerMixin
+from cache import CacheManager, TTLCache
 from config import Config
+from utils import create_http_session
+from async_downloader import AsyncRateLimiter
+from arxiv_parser import (
+    XML_ERRORS, iter_entries,
+    ID_TAG, TITLE_TAG, SUMMARY_TAG, PUBLISHED_TAG, AUTHOR_TAG, NAME_TAG,
+    CATEGORY_TAG, LINK_TAG, COMMENT_TAG, JOURNAL_REF_TAG, DOI_TAG
+)
+
+try:
+    import httpx
+except ImportError:  # optional, only needed for use_http2
+    httpx = None
+
+# Errors the HTTP clients raise for failed requests
+_REQUEST_ERRORS = (requests.RequestException,) + ((httpx.HTTPError,) if httpx is not None else ())
+
+# Errors reading a streamed body; urllib3 raises these directly, not wrapped by requests
+_STREAM_ERRORS = (urllib3.exceptions.HTTPError, OSError)
+
+# Single-valued text children and the field each one fills
+_TEXT_FIELDS = {
+    ID_TAG: 'id',
+    TITLE_TAG: 'title',
+    SUMMARY_TAG: 'summary',
+    PUBLISHED_TAG: 'published',
+    COMMENT_TAG: 'comment',
+    JOURNAL_REF_TAG: 'journal_ref',
+    DOI_TAG: 'doi',
+}
+
+# arXiv identifier formats, e.g. 2301.00001v2 and hep-th/9901001
+_ARXIV_ID_NEW = re.compile(r'^\d{4}\.\d{4,5}(v\d+)?$')
+_ARXIV_ID_OLD = re.compile(r'^[a-z-]+/\d{7}(v\d+)?$')
 
 
 class SortBy(Enum):
@@ -49,29 +92,58 @@ class SearchField(Enum):
     LAST_UPDATED_DATE = "lastUpdatedDate"  # Last update date
 
 
-@dataclass
+@functools.lru_cache(maxsize=256)
+def _search_query_string(terms: Tuple[str, ...], field: SearchField, operator: str) -> str:
+    """Query string for SearchQuery, memoized on its (hashable) field values"""
+    if not terms:
+        return ""
+    
+    field_prefix = f"{field.value}:" if field != SearchField.ALL else ""
+    
+    if len(terms) == 1:
+        return f"{field_prefix}{terms[0]}"
+    
+    # For multiple terms, wrap each in quotes and join with operator
+    quoted_terms = [f'"{term}"' if ' ' in term else term for term in terms]
+    return f"{field_prefix}({f' {operator} '.join(quoted_terms)})"
+
+
+@functools.lru_cache(maxsize=256)
+def _date_range_string(start_date: Optional[str], end_date: Optional[str],
+                       field: SearchField) -> str:
+    """Query string for DateRange, memoized on its field values"""
+    if not start_date and not end_date:
+        return ""
+    
+    # Convert YYYY-MM-DD to YYYYMMDD format
+    # ArXiv API range format: submittedDate:[20241201 TO 20241203]
+    # Note: Wildcards don't work in ranges, and use spaces not plus signs
+    start = start_date.replace('-', '') if start_date else '*'
+    end = end_date.replace('-', '') if end_date else '*'
+    
+    return f"{field.value}:[{start} TO {end}]"
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class SearchQuery:
-    """Represents a structured search query for arXiv API"""
-    terms: List[str]
+    """Represents a structured search query for arXiv API
+    
+    Any sequence of terms is accepted and stored as a tuple, keeping the
+    query immutable and hashable.
+    """
+    terms: Sequence[str]
     field: SearchField = SearchField.ALL
     operator: str = "AND"  # AND, OR, ANDNOT
     
+    def __post_init__(self):
+        object.__setattr__(self, 'terms', tuple(self.terms))
+    
     def to_string(self) -> str:
         """Convert search query to arXiv API query string"""
-        if not self.terms:
-            return ""
-        
-        field_prefix = f"{self.field.value}:" if self.field != SearchField.ALL else ""
-        
-        if len(self.terms) == 1:
-            return f"{field_prefix}{self.terms[0]}"
-        
-        # For multiple terms, wrap each in quotes and join with operator
-        quoted_terms = [f'"{term}"' if ' ' in term else term for term in self.terms]
-        return f"{field_prefix}({f' {self.operator} '.join(quoted_terms)})"
+        return _search_query_string(self.terms, self.field, self.operator)
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class DateRange:
     """Represents a date range for filtering arXiv papers"""
     start_date: Optional[str] = None  # Format: YYYY-MM-DD
@@ -80,22 +152,13 @@ class DateRange:
     
     def to_query_string(self) -> str:
         """Convert date range to arXiv API query string"""
-        if not self.start_date and not self.end_date:
-            return ""
-        
-        # Convert YYYY-MM-DD to YYYYMMDD format
-        # ArXiv API range format: submittedDate:[20241201 TO 20241203]
-        # Note: Wildcards don't work in ranges, and use spaces not plus signs
-        start = self.start_date.replace('-', '') if self.start_date else '*'
-        end = self.end_date.replace('-', '') if self.end_date else '*'
-        
-        return f"{self.field.value}:[{start} TO {end}]"
+        return _date_range_string(self.start_date, self.end_date, self.field)
 
 
 class EnhancedArxivAPI(LoggerMixin):
     """Enhanced ArXiv API client with comprehensive query support"""
     
-    BASE_URL = "http://export.arxiv.org/api/query"
+    BASE_URL = "https://export.arxiv.org/api/query"
     
     # arXiv API namespaces
     NAMESPACES = {
@@ -108,7 +171,9 @@ class EnhancedArxivAPI(LoggerMixin):
                  timeout: int = Config.API_TIMEOUT,
                  max_retries: int = Config.MAX_RETRIES,
                  retry_delay: float = Config.RETRY_DELAY_BASE,
-                 user_agent: str = "Enhanced-ArXiv-Client/1.0"):
+                 user_agent: str = "Enhanced-ArXiv-Client/1.0",
+                 cache: Optional[CacheManager] = None,
+                 use_http2: bool = False):
         """Initialize the enhanced arXiv API client
         
         Args:
@@ -116,11 +181,37 @@ class EnhancedArxivAPI(LoggerMixin):
             max_retries: Maximum number of retry attempts
             retry_delay: Base delay for exponential backoff
             user_agent: User agent string for requests
+            cache: Cache for raw API responses, every request goes to arXiv if None
+            use_http2: Send requests through an httpx HTTP/2 client, so concurrent
+                pages share one multiplexed connection (needs httpx[http2])
+        
+        Raises:
+            ValidationError: use_http2 requested but httpx is not installed
         """
         self.timeout = timeout
+        self.cache = cache
+        # Parsed results of recent searches, so repeats skip the request and the parse
+        self._results = TTLCache(maxsize=Config.SEARCH_RESULTS_CACHE_SIZE,
+                                 ttl=Config.SEARCH_CACHE_TTL)
         self.max_retries = max_retries
         self.retry_delay = retry_delay
-        self.session = requests.Session()
+        self.use_http2 = use_http2
+        if use_http2:
+            if httpx is None:
+                raise ValidationError("use_http2 requires httpx: pip install 'httpx[http2]'")
+            # httpx only retries failed connections, not error responses
+            self.session = httpx.Client(
+                timeout=timeout,
+                transport=httpx.HTTPTransport(
+                    http2=True,
+                    retries=max(max_retries - 1, 0),
+                    limits=httpx.Limits(max_connections=Config.HTTP_POOL_MAXSIZE)
+                )
+            )
+        else:
+            # urllib3 does the retrying: exponential backoff that honors Retry-After
+            self.session = create_http_session(max_retries=max(max_retries - 1, 0),
+                                               backoff_factor=retry_delay)
         self.session.headers.update({
             'User-Agent': user_agent,
             'Accept': 'application/atom+xml'
@@ -134,7 +225,8 @@ class EnhancedArxivAPI(LoggerMixin):
                      max_results: int = Config.DEFAULT_MAX_RESULTS,
                      start: int = 0,
                      sort_by: SortBy = SortBy.RELEVANCE,
-                     sort_order: SortOrder = SortOrder.DESCENDING) -> List[Paper]:
+                     sort_order: SortOrder = SortOrder.DESCENDING,
+                     collapse_categories: bool = False) -> List[Paper]:
         """Search arXiv papers with enhanced query capabilities
         
         Args:
@@ -146,6 +238,9 @@ class EnhancedArxivAPI(LoggerMixin):
             start: Starting index for pagination
             sort_by: Sort criterion
             sort_order: Sort order
+            collapse_categories: Query categories of a single archive (e.g. cs.AI
+                and cs.LG) as the whole archive, cat:cs.*, which is shorter but
+                also matches its other categories
             
         Returns:
             List of Paper objects
@@ -167,16 +262,169 @@ class EnhancedArxivAPI(LoggerMixin):
             max_results=max_results,
             start=start,
             sort_by=sort_by,
-            sort_order=sort_order
+            sort_order=sort_order,
+            collapse_categories=collapse_categories
+        )
+        
+        return self._fetch_papers(params)
+    
+    def iter_papers(self,
+                    query: Union[str, SearchQuery, List[SearchQuery]] = None,
+                    id_list: Optional[List[str]] = None,
+                    date_range: Optional[DateRange] = None,
+                    categories: Optional[List[str]] = None,
+                    max_results: int = Config.DEFAULT_MAX_RESULTS,
+                    start: int = 0,
+                    sort_by: SortBy = SortBy.RELEVANCE,
+                    sort_order: SortOrder = SortOrder.DESCENDING,
+                    collapse_categories: bool = False) -> Iterator[Paper]:
+        """Search arXiv papers, yielding each one as soon as its entry is parsed
+        
+        Takes the same arguments as search_papers. Without a cache the response
+        is parsed while it downloads, so the first paper is available before
+        the feed has finished and only one entry is held in memory at a time.
+        
+        Yields:
+            Paper objects in result order
+            
+        Raises:
+            ValidationError: Invalid parameters
+            NetworkError: Network request failed
+            ParseError: XML parsing failed
+        """
+        self._validate_search_params(query, id_list, max_results, start, categories)
+        
+        params = self._build_query_params(
+            query=query,
+            id_list=id_list,
+            date_range=date_range,
+            categories=categories,
+            max_results=max_results,
+            start=start,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            collapse_categories=collapse_categories
+        )
+        
+        yield from self._iter_request(params)
+    
+    def search_papers_paginated(self,
+                                query: Union[str, SearchQuery, List[SearchQuery]] = None,
+                                date_range: Optional[DateRange] = None,
+                                categories: Optional[List[str]] = None,
+                                max_results: int = Config.DEFAULT_MAX_RESULTS,
+                                start: int = 0,
+                                sort_by: SortBy = SortBy.RELEVANCE,
+                                sort_order: SortOrder = SortOrder.DESCENDING,
+                                page_size: int = Config.SEARCH_PAGE_SIZE,
+                                collapse_categories: bool = False) -> List[Paper]:
+        """Search arXiv papers, fetching result pages concurrently on threads
+        
+        Synchronous counterpart of search_papers_async: pages of page_size are
+        requested through the pooled session by at most
+        Config.SEARCH_PAGE_CONCURRENCY threads at once.
+        
+        Args:
+            query: Search query (string, SearchQuery object, or list of SearchQuery objects)
+            date_range: Date range filter
+            categories: List of subject categories to filter by
+            max_results: Maximum number of results to return
+            start: Starting index for pagination
+            sort_by: Sort criterion
+            sort_order: Sort order
+            page_size: Results requested per API call
+            collapse_categories: See search_papers
+            
+        Returns:
+            List of Paper objects in result order
+            
+        Raises:
+            ValidationError: Invalid parameters
+            NetworkError: Network request failed
+            ParseError: XML parsing failed
+        """
+        self._validate_search_params(query, None, max_results, start, categories)
+        
+        page_params = self._page_params(
+            start, max_results, page_size,
+            query=query,
+            date_range=date_range,
+            categories=categories,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            collapse_categories=collapse_categories
+        )
+        
+        with ThreadPoolExecutor(max_workers=Config.SEARCH_PAGE_CONCURRENCY) as pool:
+            pages = list(pool.map(self._fetch_papers, page_params))
+        
+        papers = [paper for page in pages for paper in page]
+        self.log_info("Retrieved %d papers from arXiv API in %d pages", len(papers), len(pages))
+        return papers
+    
+    async def search_papers_async(self,
+                                  query: Union[str, SearchQuery, List[SearchQuery]] = None,
+                                  date_range: Optional[DateRange] = None,
+                                  categories: Optional[List[str]] = None,
+                                  max_results: int = Config.DEFAULT_MAX_RESULTS,
+                                  start: int = 0,
+                                  sort_by: SortBy = SortBy.RELEVANCE,
+                                  sort_order: SortOrder = SortOrder.DESCENDING,
+                                  page_size: int = Config.SEARCH_PAGE_SIZE,
+                                  collapse_categories: bool = False) -> List[Paper]:
+        """Search arXiv papers, fetching result pages concurrently
+        
+        Large result sets are split into pages of page_size that are requested
+        in parallel (at most Config.SEARCH_PAGE_CONCURRENCY at once), so their
+        transfers overlap. Requests start no faster than Config.RATE_LIMIT_REQUESTS
+        per Config.RATE_LIMIT_PERIOD, the rate arXiv asks API clients to keep.
+        
+        Args:
+            query: Search query (string, SearchQuery object, or list of SearchQuery objects)
+            date_range: Date range filter
+            categories: List of subject categories to filter by
+            max_results: Maximum number of results to return
+            start: Starting index for pagination
+            sort_by: Sort criterion
+            sort_order: Sort order
+            page_size: Results requested per API call
+            collapse_categories: See search_papers
+            
+        Returns:
+            List of Paper objects in result order
+            
+        Raises:
+            ValidationError: Invalid parameters
+            NetworkError: Network request failed
+            ParseError: XML parsing failed
+        """
+        self._validate_search_params(query, None, max_results, start, categories)
+        
+        page_params = self._page_params(
+            start, max_results, page_size,
+            query=query,
+            date_range=date_range,
+            categories=categories,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            collapse_categories=collapse_categories
         )
         
-        # Make API request
-        response_text = self._make_request(params)
+        semaphore = asyncio.Semaphore(Config.SEARCH_PAGE_CONCURRENCY)
+        rate_limiter = AsyncRateLimiter(Config.RATE_LIMIT_REQUESTS, Config.RATE_LIMIT_PERIOD)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        async with aiohttp.ClientSession(headers=dict(self.session.headers),
+                                         timeout=timeout) as session:
+            pages = await asyncio.gather(*[
+                self._make_request_async(session, params, semaphore, rate_limiter)
+                for params in page_params
+            ])
         
-        # Parse response
-        papers = self._parse_response(response_text)
+        papers = []
+        for body in pages:
+            papers.extend(self._parse_response(body))
         
-        self.log_info(f"Retrieved {len(papers)} papers from arXiv API")
+        self.log_info("Retrieved %d papers from arXiv API in %d pages", len(papers), len(pages))
         return papers
     
     def get_paper_by_id(self, arxiv_id: str, version: Optional[int] = None) -> Optional[Paper]:
@@ -217,11 +465,8 @@ class EnhancedArxivAPI(LoggerMixin):
     
     def _is_valid_arxiv_id(self, arxiv_id: str) -> bool:
         """Validate arXiv ID format"""
-        import re
-        # Support both old and new arXiv ID formats
-        old_format = re.match(r'^[a-z-]+/\d{7}(v\d+)?$', arxiv_id)
-        new_format = re.match(r'^\d{4}\.\d{4,5}(v\d+)?$', arxiv_id)
-        return bool(old_format or new_format)
+        # Support both old and new arXiv ID formats, new (far more common) first
+        return bool(_ARXIV_ID_NEW.match(arxiv_id) or _ARXIV_ID_OLD.match(arxiv_id))
     
     def _build_query_params(self, **kwargs) -> Dict[str, Any]:
         """Build query parameters for arXiv API request"""
@@ -247,11 +492,8 @@ class EnhancedArxivAPI(LoggerMixin):
         
         # Add category filter
         if kwargs.get('categories'):
-            cat_queries = [f"cat:{cat}" for cat in kwargs['categories']]
-            if len(cat_queries) == 1:
-                query_parts.append(cat_queries[0])
-            else:
-                query_parts.append(f"({' OR '.join(cat_queries)})")
+            query_parts.append(_category_query(kwargs['categories'],
+                                               kwargs.get('collapse_categories', False)))
         
         # Combine query parts
         if query_parts:
@@ -261,135 +503,228 @@ class EnhancedArxivAPI(LoggerMixin):
         if kwargs.get('id_list'):
             params['id_list'] = ','.join(kwargs['id_list'])
         
-        # Add pagination and sorting
-        params.update({
-            'start': kwargs.get('start', 0),
-            'max_results': kwargs.get('max_results', Config.DEFAULT_MAX_RESULTS),
-            'sortBy': kwargs.get('sort_by', SortBy.RELEVANCE).value,
-            'sortOrder': kwargs.get('sort_order', SortOrder.DESCENDING).value
-        })
+        # Add pagination
+        params['start'] = kwargs.get('start', 0)
+        params['max_results'] = kwargs.get('max_results', Config.DEFAULT_MAX_RESULTS)
+        
+        # Add sorting, except for pure ID lookups where order is meaningless;
+        # leaving it out also keeps their cache keys canonical
+        search_query = params.get('search_query', '')
+        if not (search_query.startswith('id:') or (not search_query and 'id_list' in params)):
+            params['sortBy'] = kwargs.get('sort_by', SortBy.RELEVANCE).value
+            params['sortOrder'] = kwargs.get('sort_order', SortOrder.DESCENDING).value
         
         return params
     
-    def _make_request(self, params: Dict[str, Any]) -> str:
-        """Make HTTP request to arXiv API with retry logic"""
-        url = f"{self.BASE_URL}?{urlencode(params)}"
-        self.log_info(f"Making request to: {url}")
+    def _page_params(self, start: int, max_results: int, page_size: int,
+                     **kwargs) -> List[Dict[str, Any]]:
+        """Query parameters for each page of page_size covering start..start+max_results"""
+        end = start + max_results
+        return [
+            self._build_query_params(start=page_start,
+                                     max_results=min(page_size, end - page_start),
+                                     **kwargs)
+            for page_start in range(start, end, page_size)
+        ]
+    
+    def _fetch_papers(self, params: Dict[str, Any]) -> List[Paper]:
+        """Fetch and parse one request, serving repeats from the search results cache"""
+        # The cache holds its own copies, so changing a returned paper can't alter it
+        request_key = self._request_key(params)
+        cached = self._results.get(request_key)
+        if cached is not None:
+            self.log_info("Retrieved %d papers from search results cache", len(cached))
+            return [paper.copy() for paper in cached]
+        
+        # Make API request, parsing entries as the response streams in
+        papers = list(self._iter_request(params))
+        self._results.set(request_key, tuple(paper.copy() for paper in papers))
+        
+        self.log_info("Retrieved %d papers from arXiv API", len(papers))
+        return papers
+    
+    @staticmethod
+    def _request_key(params: Dict[str, Any]) -> str:
+        """Cache key for a request, independent of parameter order"""
+        canonical = urlencode(sorted(params.items()))
+        return hashlib.blake2b(canonical.encode('utf-8'), digest_size=16).hexdigest()
+    
+    def _make_request(self, params: Dict[str, Any]) -> bytes:
+        """Make HTTP request to arXiv API with retry logic, serving repeats from the cache
+        
+        Returns the raw UTF-8 body; arXiv feeds are always UTF-8, so decoding
+        (and requests' charset detection) is left out of the parse path.
+        """
+        request_key = self._request_key(params)
+        if self.cache is not None:
+            cached = self.cache.get_response(request_key)
+            if cached is not None:
+                return cached.encode('utf-8')
+        
+        body = self._get_with_retry(params).content
+        if self.cache is not None:
+            self.cache.save_response(request_key, body.decode('utf-8'))
+        return body
+    
+    def _iter_request(self, params: Dict[str, Any]) -> Iterator[Paper]:
+        """Request a page of results, yielding papers as their entries are parsed"""
+        # Cached responses must be read whole to be stored, so only stream uncached
+        # ones; the httpx client has no raw file-like body to parse from
+        if self.cache is not None or self.use_http2:
+            yield from self._parse_response(self._make_request(params))
+            return
+        
+        response = self._get_with_retry(params, stream=True)
+        with response:
+            response.raw.decode_content = True
+            try:
+                yield from self._iter_entries(response.raw)
+            except _STREAM_ERRORS as e:
+                raise NetworkError(f"Connection lost while reading response: {e}")
+    
+    def _get_with_retry(self, params: Dict[str, Any], stream: bool = False) -> Any:
+        """Send a GET to the arXiv API
+        
+        Retries happen inside the session's transport adapter, see __init__.
+        
+        Args:
+            params: Query parameters
+            stream: Leave the body unread so it can be consumed incrementally
+            
+        Returns:
+            Successful requests or httpx response
+        """
+        self.log_info("Making request to: %s?%s", self.BASE_URL, urlencode(params))
+        
+        # httpx.Client.get has no stream flag, its timeout is set on the client
+        request_kwargs = {} if self.use_http2 else {'timeout': self.timeout, 'stream': stream}
+        try:
+            response = self.session.get(self.BASE_URL, params=params, **request_kwargs)
+            response.raise_for_status()
+            self.log_debug("Response Content-Encoding: %s", response.headers.get('Content-Encoding', 'identity'))
+            return response
+        except _REQUEST_ERRORS as e:
+            raise NetworkError(f"Request failed after {self.max_retries} attempts: {e}")
+    
+    async def _make_request_async(self, session: aiohttp.ClientSession,
+                                  params: Dict[str, Any],
+                                  semaphore: asyncio.Semaphore,
+                                  rate_limiter: AsyncRateLimiter) -> bytes:
+        """Make async HTTP request to arXiv API with retry logic, serving repeats from the cache"""
+        request_key = self._request_key(params)
+        if self.cache is not None:
+            cached = self.cache.get_response(request_key)
+            if cached is not None:
+                return cached.encode('utf-8')
+        
+        self.log_info("Making request to: %s?%s", self.BASE_URL, urlencode(params))
         
         for attempt in range(self.max_retries):
             try:
-                response = self.session.get(
-                    self.BASE_URL,
-                    params=params,
-                    timeout=self.timeout
-                )
-                response.raise_for_status()
-                return response.text
+                async with semaphore:
+                    await rate_limiter.acquire()
+                    async with session.get(self.BASE_URL, params=params) as response:
+                        response.raise_for_status()
+                        body = await response.read()
+                if self.cache is not None:
+                    self.cache.save_response(request_key, body.decode('utf-8'))
+                return body
                 
-            except requests.RequestException as e:
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
                 if attempt == self.max_retries - 1:
                     raise NetworkError(f"Request failed after {self.max_retries} attempts: {e}")
                 
-                wait_time = self.retry_delay ** attempt
-                self.log_warning(f"Request failed, retrying in {wait_time}s (attempt {attempt + 1}/{self.max_retries}): {e}")
-                time.sleep(wait_time)
+                wait_time = self.retry_delay * 2 ** attempt
+                self.log_warning("Request failed, retrying in %ss (attempt %s/%s): %s", wait_time, attempt + 1, self.max_retries, e)
+                await asyncio.sleep(wait_time)
         
         raise NetworkError("Request retry attempts exhausted")
     
-    def _parse_response(self, response_text: str) -> List[Paper]:
-        """Parse arXiv API XML response"""
-        try:
-            root = ET.fromstring(response_text)
-        except ET.ParseError as e:
-            raise ParseError(f"Failed to parse XML response: {e}")
+    def _parse_response(self, body: bytes) -> List[Paper]:
+        """Parse arXiv API XML response
         
-        papers = []
-        
-        # Find all entry elements
-        entries = root.findall('atom:entry', self.NAMESPACES)
+        Entries are parsed incrementally, so no tree of the whole feed is built.
+        """
+        return list(self._iter_entries(io.BytesIO(body)))
+    
+    def _iter_entries(self, source) -> Iterator[Paper]:
+        """Incrementally parse an arXiv API feed from a binary file-like object
         
-        for entry in entries:
-            try:
+        Entries missing an ID, title or PDF link are skipped and reported in
+        one warning once the feed is exhausted.
+        """
+        total = 0
+        skipped = 0
+        try:
+            for entry in iter_entries(source):
+                total += 1
                 paper = self._parse_paper_entry(entry)
-                if paper:
-                    papers.append(paper)
-            except Exception as e:
-                self.log_warning(f"Failed to parse paper entry: {e}")
-                continue
+                if paper is None:
+                    skipped += 1
+                else:
+                    yield paper
+        except XML_ERRORS as e:
+            raise ParseError(f"Failed to parse XML response: {e}")
         
-        return papers
+        if skipped:
+            self.log_warning("Skipped %d of %d paper entries missing an ID, title or PDF URL",
+                             skipped, total)
     
     def _parse_paper_entry(self, entry: ET.Element) -> Optional[Paper]:
-        """Parse a single paper entry from XML"""
-        try:
-            # Extract basic information
-            paper_id = self._extract_text(entry, 'atom:id', self.NAMESPACES)
-            if paper_id:
-                # Extract arXiv ID from URL
-                paper_id = paper_id.split('/')[-1]
-            
-            title = self._extract_text(entry, 'atom:title', self.NAMESPACES)
-            if title:
-                title = ' '.join(title.split())  # Clean whitespace
-            
-            summary = self._extract_text(entry, 'atom:summary', self.NAMESPACES)
-            if summary:
-                summary = ' '.join(summary.split())  # Clean whitespace
-            
-            published = self._extract_text(entry, 'atom:published', self.NAMESPACES)
-            updated = self._extract_text(entry, 'atom:updated', self.NAMESPACES)
-            
-            # Extract authors
-            authors = []
-            author_elements = entry.findall('atom:author', self.NAMESPACES)
-            for author_elem in author_elements:
-                name = self._extract_text(author_elem, 'atom:name', self.NAMESPACES)
-                if name:
-                    authors.append(name)
-            
-            # Extract categories
-            categories = []
-            category_elements = entry.findall('atom:category', self.NAMESPACES)
-            for cat_elem in category_elements:
-                term = cat_elem.get('term')
+        """Parse a single paper entry from XML
+        
+        Walks the entry's children once, dispatching on their tags, so the
+        same code serves lxml and ElementTree elements.
+        
+        Returns:
+            Paper object, None if the entry lacks an ID, title or PDF URL
+        """
+        fields: Dict[str, str] = {}
+        authors = []
+        categories = []
+        pdf_url = None
+        
+        for child in entry:
+            tag = child.tag
+            field = _TEXT_FIELDS.get(tag)
+            if field is not None:
+                if field not in fields and child.text:
+                    fields[field] = child.text.strip()
+            elif tag == AUTHOR_TAG:
+                name = child.find(NAME_TAG)
+                if name is not None and name.text:
+                    authors.append(name.text.strip())
+            elif tag == CATEGORY_TAG:
+                term = child.get('term')
                 if term:
                     categories.append(term)
-            
-            # Extract PDF URL
-            pdf_url = None
-            link_elements = entry.findall('atom:link', self.NAMESPACES)
-            for link_elem in link_elements:
-                if link_elem.get('type') == 'application/pdf':
-                    pdf_url = link_elem.get('href')
-                    break
-            
-            # Extract arXiv-specific metadata
-            comment = self._extract_text(entry, 'arxiv:comment', self.NAMESPACES)
-            journal_ref = self._extract_text(entry, 'arxiv:journal_ref', self.NAMESPACES)
-            doi = self._extract_text(entry, 'arxiv:doi', self.NAMESPACES)
-            
-            # Create Paper object
-            return Paper(
-                id=paper_id or "",
-                title=title or "",
-                authors=authors,
-                abstract=summary or "",
-                pdf_url=pdf_url or "",
-                published=published or "",
-                categories=categories,
-                comment=comment,
-                journal_ref=journal_ref,
-                doi=doi
-            )
-            
-        except Exception as e:
-            self.log_warning(f"Error parsing paper entry: {e}")
+            elif tag == LINK_TAG:
+                if pdf_url is None and child.get('type') == 'application/pdf':
+                    pdf_url = child.get('href')
+        
+        # Extract arXiv ID from URL
+        paper_id = fields.get('id', '')
+        paper_id = paper_id[paper_id.rfind('/') + 1:]
+        
+        title = _collapse_whitespace(fields.get('title', ''))
+        
+        # The lists are built here, so only these need the checks Paper() would run
+        if not paper_id or not title or not pdf_url or not pdf_url.startswith('http'):
             return None
-    
-    def _extract_text(self, element: ET.Element, xpath: str, namespaces: Dict[str, str]) -> Optional[str]:
-        """Extract text content from XML element"""
-        found = element.find(xpath, namespaces)
-        return found.text.strip() if found is not None and found.text else None
+        
+        # Create Paper object, collapsing whitespace in the free text
+        return Paper._unchecked(
+            id=paper_id,
+            title=title,
+            authors=authors,
+            abstract=_collapse_whitespace(fields.get('summary', '')),
+            pdf_url=pdf_url,
+            published=fields.get('published', ''),
+            categories=categories,
+            comment=fields.get('comment'),
+            journal_ref=fields.get('journal_ref'),
+            doi=fields.get('doi')
+        )
     
     def close(self):
         """Close the HTTP session"""
@@ -402,47 +737,99 @@ class EnhancedArxivAPI(LoggerMixin):
         self.close()
 
 
+def _category_query(categories: List[str], collapse: bool = False) -> str:
+    """Query term matching any of the given categories
+    
+    Args:
+        categories: Subject categories, e.g. ['cs.AI', 'cs.LG']
+        collapse: Replace several categories of one archive with an archive
+            wildcard, e.g. cat:cs.*
+    
+    Returns:
+        Single cat: term or a parenthesized OR of them
+    """
+    if collapse and len(categories) > 1:
+        archives = {cat.partition('.')[0] for cat in categories}
+        if len(archives) == 1 and all('.' in cat for cat in categories):
+            return f"cat:{archives.pop()}.*"
+    
+    cat_queries = [f"cat:{cat}" for cat in categories]
+    if len(cat_queries) == 1:
+        return cat_queries[0]
+    return f"({' OR '.join(cat_queries)})"
+
+
+def _collapse_whitespace(text: str) -> str:
+    """Replace each whitespace run with one space, skipping clean single-line text"""
+    if '\n' in text or '  ' in text or '\t' in text:
+        return Config.WHITESPACE_RE.sub(' ', text).strip()
+    return text.strip()
+
+
+
 # Convenience functions for common use cases
+_default_client: Optional[EnhancedArxivAPI] = None
+_default_client_lock = threading.Lock()
+
+
+def _get_default_client() -> EnhancedArxivAPI:
+    """Shared client for the convenience functions, created on first use
+    
+    Reusing one client keeps its connections to arXiv alive between calls.
+    """
+    global _default_client
+    with _default_client_lock:
+        if _default_client is None:
+            _default_client = EnhancedArxivAPI()
+            atexit.register(_default_client.close)
+        return _default_client
+
+
 def search_by_keyword(keyword: str, 
                      field: SearchField = SearchField.ALL,
-                     max_results: int = 10) -> List[Paper]:
+                     max_results: int = 10,
+                     api: Optional[EnhancedArxivAPI] = None) -> List[Paper]:
     """Search papers by keyword in specified field"""
-    with EnhancedArxivAPI() as api:
-        query = SearchQuery(terms=[keyword], field=field)
-        return api.search_papers(query=query, max_results=max_results)
+    api = api if api is not None else _get_default_client()
+    query = SearchQuery(terms=[keyword], field=field)
+    return api.search_papers(query=query, max_results=max_results)
 
 
-def search_by_author(author_name: str, max_results: int = 10) -> List[Paper]:
+def search_by_author(author_name: str, max_results: int = 10,
+                     api: Optional[EnhancedArxivAPI] = None) -> List[Paper]:
     """Search papers by author name"""
-    with EnhancedArxivAPI() as api:
-        query = SearchQuery(terms=[author_name], field=SearchField.AUTHOR)
-        return api.search_papers(query=query, max_results=max_results)
+    api = api if api is not None else _get_default_client()
+    query = SearchQuery(terms=[author_name], field=SearchField.AUTHOR)
+    return api.search_papers(query=query, max_results=max_results)
 
 
 def search_by_category(category: str, 
                       date_range: Optional[DateRange] = None,
-                      max_results: int = 10) -> List[Paper]:
+                      max_results: int = 10,
+                      api: Optional[EnhancedArxivAPI] = None) -> List[Paper]:
     """Search papers by category with optional date range"""
-    with EnhancedArxivAPI() as api:
-        return api.search_papers(
-            categories=[category],
-            date_range=date_range,
-            max_results=max_results,
-            sort_by=SortBy.SUBMITTED_DATE,
-            sort_order=SortOrder.DESCENDING
-        )
+    api = api if api is not None else _get_default_client()
+    return api.search_papers(
+        categories=[category],
+        date_range=date_range,
+        max_results=max_results,
+        sort_by=SortBy.SUBMITTED_DATE,
+        sort_order=SortOrder.DESCENDING
+    )
 
 
-def get_recent_papers(category: str = "cs.AI", days: int = 7, max_results: int = 20) -> List[Paper]:
+def get_recent_papers(category: str = "cs.AI", days: int = 7, max_results: int = 20,
+                      api: Optional[EnhancedArxivAPI] = None) -> List[Paper]:
     """Get recent papers from the last N days in specified category"""
-    from datetime import datetime, timedelta
+    from datetime import date, timedelta
     
-    end_date = datetime.now()
+    end_date = date.today()
     start_date = end_date - timedelta(days=days)
     
+    # isoformat() gives YYYY-MM-DD without going through strftime
     date_range = DateRange(
-        start_date=start_date.strftime('%Y-%m-%d'),
-        end_date=end_date.strftime('%Y-%m-%d')
+        start_date=start_date.isoformat(),
+        end_date=end_date.isoformat()
     )
     
-    return search_by_category(category, date_range, max_results)
\ No newline at end of file
+    return search_by_category(category, date_range, max_results, api=api)
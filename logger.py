@@ -1,18 +1,38 @@
 """Logging system module"""
 
+import atexit
 import logging
+import logging.handlers
+import os
+import queue
 import sys
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Any, List, Optional, Set
 
 from config import Config
 
+# Log directories already created by this process
+_created_log_dirs: Set[Path] = set()
+
+# Serializes handler setup so concurrent callers don't open the log file twice
+_setup_lock = threading.Lock()
+
+# Background thread that owns the file/console handlers, fed by _queue_handler
+_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional[logging.handlers.QueueHandler] = None
+
 def setup_logging(log_level: int = logging.INFO, 
                  log_dir: Optional[Path] = None,
                  console_output: bool = True) -> logging.Logger:
     """Setup logging system
     
+    Records are queued and written by a background listener thread, so
+    logging never blocks the caller on file or console I/O. Safe to call
+    repeatedly: handlers already writing to the same log file or console
+    are reused rather than reopened, others are closed.
+    
     Args:
         log_level: Log level
         log_dir: Log directory, use default if None
@@ -25,15 +45,12 @@ def setup_logging(log_level: int = logging.INFO,
     if log_dir is None:
         log_dir = Config.get_log_dir()
     
-    # Ensure log directory exists
-    log_dir.mkdir(parents=True, exist_ok=True)
-    
-    # Create logger
-    logger = logging.getLogger('arxiv_downloader')
-    logger.setLevel(log_level)
+    # Ensure log directory exists, once per directory per process
+    if log_dir not in _created_log_dirs:
+        log_dir.mkdir(parents=True, exist_ok=True)
+        _created_log_dirs.add(log_dir)
     
-    # Clear existing handlers
-    logger.handlers.clear()
+    log_file = log_dir / f'arxiv_downloader_{datetime.now().strftime("%Y%m%d")}.log'
     
     # Create formatter
     formatter = logging.Formatter(
@@ -41,22 +58,76 @@ def setup_logging(log_level: int = logging.INFO,
         datefmt=Config.LOG_DATE_FORMAT
     )
     
-    # File handler
-    log_file = log_dir / f'arxiv_downloader_{datetime.now().strftime("%Y%m%d")}.log'
-    file_handler = logging.FileHandler(log_file, encoding='utf-8')
-    file_handler.setLevel(log_level)
-    file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
-    
-    # Console handler
-    if console_output:
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(log_level)
-        console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
+    global _listener, _queue_handler
+    with _setup_lock:
+        # Create logger
+        logger = logging.getLogger('arxiv_downloader')
+        logger.setLevel(log_level)
+        
+        # Drain the queue before touching the handlers it writes to
+        existing = list(logger.handlers)
+        if _listener is not None:
+            _listener.stop()
+            existing += _listener.handlers
+        
+        # Split existing handlers into reusable ones and ones to close
+        file_handler = None
+        console_handler = None
+        for handler in existing:
+            if handler is _queue_handler:
+                continue
+            if (file_handler is None and isinstance(handler, logging.FileHandler)
+                    and handler.baseFilename == os.path.abspath(log_file)):
+                file_handler = handler
+            elif (console_output and console_handler is None
+                    and type(handler) is logging.StreamHandler and handler.stream is sys.stdout):
+                console_handler = handler
+            else:
+                handler.close()
+        
+        # File handler
+        if file_handler is None:
+            file_handler = logging.FileHandler(log_file, encoding='utf-8')
+        file_handler.setLevel(log_level)
+        file_handler.setFormatter(formatter)
+        handlers: List[logging.Handler] = [file_handler]
+        
+        # Console handler
+        if console_output:
+            if console_handler is None:
+                console_handler = logging.StreamHandler(sys.stdout)
+            console_handler.setLevel(log_level)
+            console_handler.setFormatter(formatter)
+            handlers.append(console_handler)
+        
+        # The logger itself only enqueues records
+        if _queue_handler is None:
+            _queue_handler = logging.handlers.QueueHandler(queue.SimpleQueue())
+            atexit.register(stop_logging)
+        for handler in list(logger.handlers):
+            if handler is not _queue_handler:
+                logger.removeHandler(handler)
+        logger.addHandler(_queue_handler)
+        
+        _listener = logging.handlers.QueueListener(
+            _queue_handler.queue, *handlers, respect_handler_level=True
+        )
+        _listener.start()
     
     return logger
 
+def stop_logging() -> None:
+    """Flush queued log records and close the log handlers"""
+    global _listener
+    with _setup_lock:
+        if _listener is None or _queue_handler is None:
+            return
+        logging.getLogger('arxiv_downloader').removeHandler(_queue_handler)
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
 def get_logger(name: str = 'arxiv_downloader') -> logging.Logger:
     """Get logger instance"""
     return logging.getLogger(name)
@@ -71,18 +142,18 @@ class LoggerMixin:
             self._logger = get_logger()
         return self._logger
     
-    def log_info(self, message: str):
-        """Log info message"""
-        self.logger.info(message)
+    def log_info(self, message: str, *args: Any):
+        """Log info message, %-formatted with args only if emitted"""
+        self.logger.info(message, *args)
     
-    def log_warning(self, message: str):
-        """Log warning message"""
-        self.logger.warning(message)
+    def log_warning(self, message: str, *args: Any):
+        """Log warning message, %-formatted with args only if emitted"""
+        self.logger.warning(message, *args)
     
-    def log_error(self, message: str):
-        """Log error message"""
-        self.logger.error(message)
+    def log_error(self, message: str, *args: Any):
+        """Log error message, %-formatted with args only if emitted"""
+        self.logger.error(message, *args)
     
-    def log_debug(self, message: str):
-        """Log debug message"""
-        self.logger.debug(message)
\ No newline at end of file
+    def log_debug(self, message: str, *args: Any):
+        """Log debug message, %-formatted with args only if emitted"""
+        self.logger.debug(message, *args)
\ No newline at end of file
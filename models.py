@@ -1,9 +1,16 @@
 """Data models and exception definitions"""
 
-from dataclasses import dataclass
-from typing import List, Optional
+import sys
+from dataclasses import dataclass, fields
+from typing import Dict, List, Optional, Sequence, Tuple, Any
 from pathlib import Path
 
+# Slotted dataclasses (no per-instance __dict__) where supported, Python 3.10+
+DATACLASS_SLOTS: Dict[str, bool] = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Characters of the abstract kept by Paper.short_abstract
+SHORT_ABSTRACT_LENGTH = 200
+
 # Exception class definitions
 class ArxivDownloadError(Exception):
     """Base class for ArXiv download related exceptions"""
@@ -11,7 +18,25 @@ class ArxivDownloadError(Exception):
 
 class NetworkError(ArxivDownloadError):
     """Network related exceptions"""
-    pass
+    
+    def __init__(self, message: str, status: Optional[int] = None):
+        super().__init__(message)
+        self.status = status
+    
+    @property
+    def retryable(self) -> bool:
+        """Whether retrying can help (client errors other than 408/429 cannot)"""
+        if self.status is None:
+            return True
+        return not (400 <= self.status < 500 and self.status not in (408, 429))
+
+class RateLimitError(NetworkError):
+    """Server rate limit (HTTP 429/503) exceptions"""
+    
+    def __init__(self, message: str, status: Optional[int] = None,
+                 retry_after: Optional[float] = None):
+        super().__init__(message, status)
+        self.retry_after = retry_after
 
 class FileOperationError(ArxivDownloadError):
     """File operation exceptions"""
@@ -25,7 +50,7 @@ class ParseError(ArxivDownloadError):
     """Parsing exceptions"""
     pass
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Paper:
     """Paper data class"""
     id: str
@@ -53,12 +78,41 @@ class Paper:
         if not isinstance(self.categories, list):
             raise ValidationError("Category information must be in list format")
     
+    def to_tuple(self) -> Tuple[Any, ...]:
+        """Get positional tuple representation (field order), used for caching"""
+        return (self.id, self.title, self.authors, self.abstract, self.pdf_url,
+                self.published, self.categories, self.comment, self.journal_ref, self.doi)
+    
+    @classmethod
+    def from_tuple(cls, values: Sequence[Any]) -> 'Paper':
+        """Create paper from positional tuple produced by to_tuple"""
+        return cls(*values)
+    
+    @classmethod
+    def _unchecked(cls, **values: Any) -> 'Paper':
+        """Create paper without running __post_init__ validation
+        
+        For parsers that have already checked the ID, title and PDF URL of
+        what they extracted; omitted fields are None.
+        """
+        paper = object.__new__(cls)
+        for name in _PAPER_FIELDS:
+            object.__setattr__(paper, name, values.get(name))
+        return paper
+    
+    def copy(self) -> 'Paper':
+        """Copy paper, including its author and category lists, without revalidating"""
+        values = {name: getattr(self, name) for name in _PAPER_FIELDS}
+        values['authors'] = list(self.authors)
+        values['categories'] = list(self.categories)
+        return Paper._unchecked(**values)
+    
     @property
-    def short_abstract(self, max_length: int = 200) -> str:
-        """Get short abstract"""
-        if len(self.abstract) <= max_length:
+    def short_abstract(self) -> str:
+        """Get abstract truncated to SHORT_ABSTRACT_LENGTH characters"""
+        if len(self.abstract) <= SHORT_ABSTRACT_LENGTH:
             return self.abstract
-        return self.abstract[:max_length] + "..."
+        return self.abstract[:SHORT_ABSTRACT_LENGTH] + "..."
     
     @property
     def authors_str(self) -> str:
@@ -70,16 +124,23 @@ class Paper:
         """Get categories string"""
         return ', '.join(self.categories)
 
-@dataclass
+_PAPER_FIELDS = tuple(f.name for f in fields(Paper))
+
+@dataclass(**DATACLASS_SLOTS)
 class DownloadStats:
     """Download statistics data class"""
     total_papers: int = 0
     successful_downloads: int = 0
     failed_downloads: int = 0
     skipped_downloads: int = 0
-    total_size_mb: float = 0.0
+    total_size_bytes: int = 0
     download_time_seconds: float = 0.0
     
+    @property
+    def total_size_mb(self) -> float:
+        """Total downloaded size in MB"""
+        return self.total_size_bytes / (1024 * 1024)
+    
     @property
     def success_rate(self) -> float:
         """Success rate"""
@@ -94,10 +155,10 @@ class DownloadStats:
             return 0.0
         return self.total_size_mb / self.download_time_seconds
     
-    def add_success(self, file_size_mb: float = 0.0):
+    def add_success(self, size_bytes: int = 0):
         """Add successful download record"""
         self.successful_downloads += 1
-        self.total_size_mb += file_size_mb
+        self.total_size_bytes += size_bytes
     
     def add_failure(self):
         """Add failed download record"""
@@ -113,7 +174,7 @@ class DownloadStats:
         self.successful_downloads = 0
         self.failed_downloads = 0
         self.skipped_downloads = 0
-        self.total_size_mb = 0.0
+        self.total_size_bytes = 0
         self.download_time_seconds = 0.0
     
     def __str__(self) -> str:
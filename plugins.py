@@ -9,12 +9,13 @@ import json
 import hashlib
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Set
+from typing import List, Dict, Any, Optional, Sequence, Set
 from datetime import datetime
 
 from models import Paper
 from logger import LoggerMixin
 from config import Config
+from utils import scan_downloaded_ids
 
 class DownloadPlugin(ABC):
     """Base class for download plugins"""
@@ -57,26 +58,27 @@ class DownloadPlugin(ABC):
 class DuplicateCheckPlugin(DownloadPlugin, LoggerMixin):
     """Duplicate check plugin"""
     
-    def __init__(self, download_dir: Optional[Path] = None):
+    def __init__(self, download_dir: Optional[Path] = None,
+                 existing_ids: Optional[Set[str]] = None):
+        """Initialize duplicate check plugin
+        
+        Args:
+            download_dir: Download directory
+            existing_ids: IDs already in the download directory, scanned lazily if None
+        """
         super().__init__("duplicate_check")
         self.download_dir = download_dir or Config.get_download_dir()
-        self.downloaded_papers: Set[str] = set()
+        self.downloaded_papers: Set[str] = set(existing_ids or ())
         self.paper_hashes: Dict[str, str] = {}
-        self._load_existing_papers()
+        self._papers_loaded = existing_ids is not None
     
     def _load_existing_papers(self):
         """Load existing papers"""
-        if not self.download_dir.exists():
-            return
-        
-        for pdf_file in self.download_dir.glob("*.pdf"):
-            # Extract paper ID from filename
-            filename = pdf_file.stem
-            if '_' in filename:
-                paper_id = filename.split('_')[0]
-                self.downloaded_papers.add(paper_id)
+        self._papers_loaded = True
+        # One directory read instead of a glob plus a stat per file
+        self.downloaded_papers.update(scan_downloaded_ids(self.download_dir))
         
-        self.log_info(f"Loaded {len(self.downloaded_papers)} downloaded papers")
+        self.log_info("Loaded %d downloaded papers", len(self.downloaded_papers))
     
     def _calculate_paper_hash(self, paper: Paper) -> str:
         """Calculate paper content hash"""
@@ -85,15 +87,17 @@ class DuplicateCheckPlugin(DownloadPlugin, LoggerMixin):
     
     def pre_download(self, paper: Paper) -> bool:
         """Check if paper is duplicate"""
-        # Check ID duplication
+        # Check ID duplication, scanning the directory on first use
+        if not self._papers_loaded:
+            self._load_existing_papers()
         if paper.id in self.downloaded_papers:
-            self.log_info(f"Paper ID duplicate, skipping download: {paper.id}")
+            self.log_info("Paper ID duplicate, skipping download: %s", paper.id)
             return False
         
         # Check content duplication
         paper_hash = self._calculate_paper_hash(paper)
         if paper_hash in self.paper_hashes.values():
-            self.log_info(f"Paper content duplicate, skipping download: {paper.id}")
+            self.log_info("Paper content duplicate, skipping download: %s", paper.id)
             return False
         
         self.paper_hashes[paper.id] = paper_hash
@@ -103,13 +107,13 @@ class DuplicateCheckPlugin(DownloadPlugin, LoggerMixin):
         """Record downloaded paper"""
         if success:
             self.downloaded_papers.add(paper.id)
-            self.log_info(f"Recorded downloaded paper: {paper.id}")
+            self.log_info("Recorded downloaded paper: %s", paper.id)
 
 class CategoryFilterPlugin(DownloadPlugin, LoggerMixin):
     """Category filter plugin"""
     
-    def __init__(self, allowed_categories: List[str] = None, 
-                 blocked_categories: List[str] = None):
+    def __init__(self, allowed_categories: Optional[Sequence[str]] = None, 
+                 blocked_categories: Optional[Sequence[str]] = None):
         super().__init__("category_filter")
         self.allowed_categories = set(allowed_categories or [])
         self.blocked_categories = set(blocked_categories or [])
@@ -120,12 +124,12 @@ class CategoryFilterPlugin(DownloadPlugin, LoggerMixin):
         
         # Check if contains blocked categories
         if self.blocked_categories and paper_categories & self.blocked_categories:
-            self.log_info(f"Paper contains blocked category, skipping download: {paper.id}")
+            self.log_info("Paper contains blocked category, skipping download: %s", paper.id)
             return False
         
         # Check if contains allowed categories
         if self.allowed_categories and not (paper_categories & self.allowed_categories):
-            self.log_info(f"Paper does not contain allowed category, skipping download: {paper.id}")
+            self.log_info("Paper does not contain allowed category, skipping download: %s", paper.id)
             return False
         
         return True
@@ -169,7 +173,7 @@ class MetadataPlugin(DownloadPlugin, LoggerMixin):
         with open(metadata_file, 'w', encoding='utf-8') as f:
             json.dump(metadata, f, ensure_ascii=False, indent=2)
         
-        self.log_info(f"Saved metadata: {paper.id}")
+        self.log_info("Saved metadata: %s", paper.id)
 
 class StatisticsPlugin(DownloadPlugin, LoggerMixin):
     """Statistics plugin"""
@@ -231,7 +235,7 @@ class StatisticsPlugin(DownloadPlugin, LoggerMixin):
             self.stats['daily_stats'][today]['successful'] += 1
         
         self._save_stats()
-        self.log_info(f"Updated statistics data: {paper.id}")
+        self.log_info("Updated statistics data: %s", paper.id)
 
 class PluginManager(LoggerMixin):
     """Plugin manager"""
@@ -242,12 +246,12 @@ class PluginManager(LoggerMixin):
     def register_plugin(self, plugin: DownloadPlugin):
         """Register plugin"""
         self.plugins.append(plugin)
-        self.log_info(f"Registered plugin: {plugin.name}")
+        self.log_info("Registered plugin: %s", plugin.name)
     
     def unregister_plugin(self, plugin_name: str):
         """Unregister plugin"""
         self.plugins = [p for p in self.plugins if p.name != plugin_name]
-        self.log_info(f"Unregistered plugin: {plugin_name}")
+        self.log_info("Unregistered plugin: %s", plugin_name)
     
     def get_plugin(self, plugin_name: str) -> Optional[DownloadPlugin]:
         """Get plugin"""
@@ -268,7 +272,7 @@ class PluginManager(LoggerMixin):
                     if not plugin.pre_download(paper):
                         return False
                 except Exception as e:
-                    self.log_error(f"Plugin {plugin.name} execution failed: {str(e)}")
+                    self.log_error("Plugin %s execution failed: %s", plugin.name, e)
         return True
     
     def post_download_hook(self, paper: Paper, filepath: Path, success: bool):
@@ -278,7 +282,7 @@ class PluginManager(LoggerMixin):
                 try:
                     plugin.post_download(paper, filepath, success)
                 except Exception as e:
-                    self.log_error(f"Plugin {plugin.name} execution failed: {str(e)}")
+                    self.log_error("Plugin %s execution failed: %s", plugin.name, e)
     
     def list_plugins(self) -> List[Dict[str, Any]]:
         """List all plugins"""
@@ -292,12 +296,18 @@ class PluginManager(LoggerMixin):
         ]
 
 # Predefined plugin configuration
-def create_default_plugins(download_dir: Optional[Path] = None) -> PluginManager:
-    """Create default plugin configuration"""
+def create_default_plugins(download_dir: Optional[Path] = None,
+                           existing_ids: Optional[Set[str]] = None) -> PluginManager:
+    """Create default plugin configuration
+    
+    Args:
+        download_dir: Download directory
+        existing_ids: IDs already downloaded, saves the duplicate check a directory scan
+    """
     manager = PluginManager()
     
     # Add default plugins
-    manager.register_plugin(DuplicateCheckPlugin(download_dir))
+    manager.register_plugin(DuplicateCheckPlugin(download_dir, existing_ids))
     manager.register_plugin(MetadataPlugin(download_dir))
     manager.register_plugin(StatisticsPlugin(download_dir))
     
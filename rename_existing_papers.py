@@ -11,6 +11,12 @@ import xml.etree.ElementTree as ET
 from pathlib import Path
 import time
 
+from arxiv_parser import ENTRY_TAG, TITLE_TAG
+
+# Filename cleanup patterns, compiled once for the whole batch
+INVALID_CHARS_RE = re.compile(r'[<>:"/\\|?*]')
+WHITESPACE_RE = re.compile(r'\s+')
+
 class PaperRenamer:
     def __init__(self, download_dir="./arxiv_papers"):
         self.download_dir = Path(download_dir)
@@ -21,9 +27,9 @@ class PaperRenamer:
         Clean filename, remove or replace illegal characters
         """
         # Remove or replace illegal filename characters
-        title = re.sub(r'[<>:"/\\|?*]', '', title)
+        title = INVALID_CHARS_RE.sub('', title)
         # Replace multiple spaces with single space
-        title = re.sub(r'\s+', ' ', title)
+        title = WHITESPACE_RE.sub(' ', title)
         # Remove leading and trailing spaces
         title = title.strip()
         # Limit filename length (avoid too long)
@@ -52,14 +58,10 @@ class PaperRenamer:
             
             # Parse XML response
             root = ET.fromstring(response.text)
-            namespaces = {
-                'atom': 'http://www.w3.org/2005/Atom',
-                'arxiv': 'http://arxiv.org/schemas/atom'
-            }
             
-            entry = root.find('atom:entry', namespaces)
+            entry = root.find(ENTRY_TAG)
             if entry is not None:
-                title_elem = entry.find('atom:title', namespaces)
+                title_elem = entry.find(TITLE_TAG)
                 if title_elem is not None:
                     return title_elem.text.strip().replace('\n', ' ')
             
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Debug script comparing a direct arXiv API call with EnhancedArxivAPI
+
+Run from anywhere: python scripts/debug_api.py
+"""
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import os
+import shutil
+
+from urllib.parse import urlencode
+from arxiv_parser import TITLE_TAG, PUBLISHED_TAG, iter_entries
+from enhanced_arxiv_api import EnhancedArxivAPI, DateRange
+from logger import get_logger
+from utils import create_http_session
+
+logger = get_logger('arxiv_downloader.debug')
+
+_SESSION = create_http_session(max_retries=3)
+
+ARXIV_API = 'https://export.arxiv.org/api/query'
+
+# Fixed search used by the direct API check
+DIRECT_PARAMS = {
+    'search_query': 'deep learning AND submittedDate:[202506010000+TO+202506152359]',
+    'start': 0,
+    'max_results': 10,
+    'sortBy': 'relevance',
+    'sortOrder': 'descending'
+}
+
+def debug_direct_api():
+    """Query the API directly and inspect the raw response"""
+    # Test direct API call first
+    print("=== Testing Direct ArXiv API Call ===")
+    url = f"{ARXIV_API}?{urlencode(DIRECT_PARAMS)}"
+    print(f"Direct URL: {url}")
+    
+    try:
+        response = _SESSION.get(ARXIV_API, params=DIRECT_PARAMS, timeout=30, stream=True)
+        print(f"Status Code: {response.status_code}")
+        
+        # Stream the response to disk for inspection instead of holding it in memory
+        response.raw.decode_content = True
+        with open('debug_response.xml', 'wb') as f:
+            shutil.copyfileobj(response.raw, f)
+        print(f"Response length: {os.path.getsize('debug_response.xml')}")
+        print("Response saved to debug_response.xml")
+        
+        # Parse XML incrementally to count entries
+        entry_count = 0
+        for entry in iter_entries('debug_response.xml'):
+            # Print first entry if exists
+            if entry_count == 0:
+                title_elem = entry.find(TITLE_TAG)
+                published_elem = entry.find(PUBLISHED_TAG)
+                if title_elem is not None:
+                    print(f"First paper title: {title_elem.text}")
+                if published_elem is not None:
+                    print(f"First paper published: {published_elem.text}")
+            entry_count += 1
+        print(f"Number of entries found: {entry_count}")
+    
+    except Exception as e:
+        print(f"Direct API call failed: {e}")
+        logger.exception('Traceback')
+
+def debug_enhanced_api():
+    """Run the same search through EnhancedArxivAPI"""
+    print("\n=== Testing Enhanced API ===")
+    api = EnhancedArxivAPI()
+    
+    # Enable debug logging
+    api.debug = True
+    
+    date_range = DateRange("2025-06-01", "2025-06-15")
+    print(f"Date range query string: {date_range.to_query_string()}")
+    
+    try:
+        papers = api.search_papers(
+            query="deep learning",
+            date_range=date_range,
+            max_results=10
+        )
+        print(f"Enhanced API found {len(papers)} papers")
+    except Exception as e:
+        print(f"Enhanced API failed: {e}")
+        logger.exception('Traceback')
+    
+    api.close()
+
+if __name__ == "__main__":
+    debug_direct_api()
+    debug_enhanced_api()
\ No newline at end of file
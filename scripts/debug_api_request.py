@@ -3,8 +3,11 @@
 Debug script to examine the actual HTTP requests sent to ArXiv API
 """
 
-import requests
-from urllib.parse import urlencode
+import sys
+from pathlib import Path
+
+# Repository modules live one directory up
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 def test_arxiv_api_directly():
     """Test ArXiv API directly using enhanced API"""
@@ -1,22 +1,37 @@
 #!/usr/bin/env python3
 
-import requests
+import sys
 import xml.etree.ElementTree as ET
+from pathlib import Path
+
+import requests
+
+# Repository modules live one directory up
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-def test_arxiv_api():
-    """Test ArXiv API connection and response"""
+from utils import create_http_session
+
+_SESSION = create_http_session(max_retries=3)
+
+ARXIV_API = 'https://export.arxiv.org/api/query'
+
+def test_arxiv_api(paper_ids=('1811.04422',)):
+    """Test ArXiv API connection and response
+    
+    All IDs are fetched in one id_list request instead of one request each.
+    """
     
-    # Test with paper ID
-    print("Testing ArXiv API with paper ID: 1811.04422")
+    # Test with paper IDs
+    print(f"Testing ArXiv API with paper IDs: {', '.join(paper_ids)}")
     
     params = {
-        'search_query': 'id:1811.04422',
+        'id_list': ','.join(paper_ids),
         'start': 0,
-        'max_results': 1
+        'max_results': len(paper_ids)
     }
     
     try:
-        response = requests.get('http://export.arxiv.org/api/query', params=params, timeout=30)
+        response = _SESSION.get(ARXIV_API, params=params, timeout=30)
         print(f"Status Code: {response.status_code}")
         print(f"Content Length: {len(response.text)}")
         
@@ -30,8 +45,7 @@ def test_arxiv_api():
                 entries = root.findall('.//{http://www.w3.org/2005/Atom}entry')
                 print(f"\nFound {len(entries)} entries in XML")
                 
-                if entries:
-                    entry = entries[0]
+                for entry in entries:
                     title_elem = entry.find('.//{http://www.w3.org/2005/Atom}title')
                     if title_elem is not None:
                         print(f"Title: {title_elem.text.strip()}")
@@ -3,6 +3,7 @@
 ArXiv Paper Downloader Installation Script
 """
 
+import os
 from setuptools import setup, find_packages
 from pathlib import Path
 
@@ -18,6 +19,13 @@ with open('requirements.txt', 'r', encoding='utf-8') as f:
         if line and not line.startswith('#'):
             requirements.append(line)
 
+# Optionally compile the response parser with mypyc:
+#   ARXIV_DOWNLOADER_MYPYC=1 python setup.py build_ext --inplace
+ext_modules = []
+if os.environ.get('ARXIV_DOWNLOADER_MYPYC'):
+    from mypyc.build import mypycify
+    ext_modules = mypycify(['arxiv_parser.py'])
+
 setup(
     name="arxiv-paper-downloader",
     version="2.0.0",
@@ -28,6 +36,7 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/yourusername/arxiv-downloader",
     packages=find_packages(),
+    ext_modules=ext_modules,
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Science/Research",
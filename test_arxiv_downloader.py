@@ -1,14 +1,22 @@
 """ArXiv downloader test module"""
 
+import pickle
 import pytest
+import sys
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 
 from arxiv_downloader import ArxivDownloader
-from models import Paper, ValidationError, NetworkError
-from utils import sanitize_filename, generate_query_hash, is_valid_date_format
+from models import Paper, DownloadStats, ValidationError, NetworkError
+from utils import (
+    sanitize_filename, generate_query_hash, is_valid_date_format, parse_retry_after,
+    create_http_session
+)
 from config import Config
+import logger as logger_module
+from logger import setup_logging, stop_logging
 
 class TestUtils:
     """Utility functions test"""
@@ -52,6 +60,40 @@ class TestUtils:
         assert is_valid_date_format('2023/01/01') == False
         assert is_valid_date_format('') == False
         assert is_valid_date_format(None) == False
+    
+    def test_parse_retry_after(self):
+        """Test Retry-After header parsing"""
+        assert parse_retry_after('120') == 120.0
+        assert parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT') == 0.0
+        assert parse_retry_after(None) is None
+        assert parse_retry_after('soon') is None
+    
+    def test_create_http_session(self):
+        """Test HTTP session pools connections for both schemes"""
+        session = create_http_session(max_retries=2)
+        adapter = session.get_adapter('https://export.arxiv.org')
+        assert adapter is session.get_adapter('http://export.arxiv.org')
+        assert adapter._pool_maxsize == Config.HTTP_POOL_MAXSIZE
+        assert adapter.max_retries.total == 2
+        assert 'gzip' in session.headers['Accept-Encoding']
+        session.close()
+    
+    def test_setup_logging_idempotent(self):
+        """Test repeated logging setup reuses the open log file"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            logger = setup_logging(log_dir=Path(temp_dir), console_output=False)
+            queue_handler = logger.handlers[0]
+            file_handler = logger_module._listener.handlers[0]
+            
+            assert setup_logging(log_dir=Path(temp_dir), console_output=False) is logger
+            assert logger.handlers == [queue_handler]
+            assert logger_module._listener.handlers == (file_handler,)
+            
+            logger.info("queued %s", "record")
+            stop_logging()
+            assert logger.handlers == []
+            log_file, = Path(temp_dir).glob('*.log')
+            assert 'queued record' in log_file.read_text(encoding='utf-8')
 
 class TestPaper:
     """Paper data class test"""
@@ -128,6 +170,73 @@ class TestPaper:
         short = paper.short_abstract
         assert len(short) <= 203  # 200 + "..."
         assert short.endswith('...')
+    
+    def test_paper_tuple_roundtrip(self):
+        """Test positional tuple conversion used by the search cache"""
+        paper = Paper(
+            id='2023.01001v1',
+            title='Test Paper',
+            authors=['Author 1'],
+            abstract='Abstract',
+            pdf_url='http://arxiv.org/pdf/2023.01001v1.pdf',
+            published='2023-01-01T00:00:00Z',
+            categories=['cs.AI'],
+            doi='10.1000/test'
+        )
+        
+        # JSON round trip turns tuples into lists
+        row = list(paper.to_tuple())
+        assert Paper.from_tuple(row) == paper
+    
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="slotted dataclasses need Python 3.10")
+    def test_paper_slots(self):
+        """Test papers carry no per-instance __dict__ and still pickle"""
+        paper = Paper(
+            id='2023.01001v1',
+            title='Test Paper',
+            authors=['Author 1'],
+            abstract='Abstract',
+            pdf_url='http://arxiv.org/pdf/2023.01001v1.pdf',
+            published='',
+            categories=[]
+        )
+        
+        assert not hasattr(paper, '__dict__')
+        assert pickle.loads(pickle.dumps(paper)) == paper
+    
+    def test_paper_unchecked(self):
+        """Test the parser fast path builds the same paper, defaulting omitted fields"""
+        values = dict(id='2023.01001v1', title='Test Paper', authors=['Author 1'],
+                      abstract='Abstract', pdf_url='http://arxiv.org/pdf/2023.01001v1.pdf',
+                      published='', categories=[])
+        
+        paper = Paper._unchecked(**values)
+        assert paper == Paper(**values)
+        assert paper.doi is None
+    
+    def test_paper_copy(self):
+        """Test copies share no lists with the original and skip validation"""
+        paper = Paper(id='2023.01001v1', title='Test Paper', authors=['Author 1'],
+                      abstract='Abstract', pdf_url='http://arxiv.org/pdf/2023.01001v1.pdf',
+                      published='', categories=['cs.AI'])
+        
+        with patch.object(Paper, '__post_init__') as mock_validate:
+            copy = paper.copy()
+        
+        assert copy == paper
+        assert copy.authors is not paper.authors and copy.categories is not paper.categories
+        mock_validate.assert_not_called()
+    
+    def test_download_stats_bytes(self):
+        """Test download sizes are summed exactly in bytes"""
+        stats = DownloadStats()
+        stats.add_success(3 * 1024 * 1024)
+        stats.add_success(1024 * 1024)
+        
+        assert stats.total_size_bytes == 4 * 1024 * 1024
+        assert stats.total_size_mb == 4.0
+        stats.reset()
+        assert stats.total_size_bytes == 0
 
 class TestArxivDownloader:
     """ArxivDownloader test"""
@@ -220,6 +329,123 @@ class TestArxivDownloader:
         result = self.downloader._parse_paper_entry(entry, namespaces)
         assert result is None  # Should return None because ID is missing
     
+    def test_parse_paper_entry_normalizes_whitespace(self):
+        """Test multi-line titles and abstracts collapse to single spaces"""
+        import xml.etree.ElementTree as ET
+        from arxiv_parser import parse_entry
+        
+        entry = ET.fromstring('''
+        <entry xmlns="http://www.w3.org/2005/Atom">
+            <id>http://arxiv.org/abs/2023.12345v1</id>
+            <title>  A Long
+              Title  </title>
+            <summary>First line
+            second   line</summary>
+            <author><name>Test Author</name></author>
+            <link href="http://arxiv.org/pdf/2023.12345v1.pdf" type="application/pdf"/>
+        </entry>
+        ''')
+        
+        result = parse_entry(entry)
+        assert result.title == "A Long Title"
+        assert result.abstract == "First line second line"
+    
+    def test_iter_entries_streams_feed(self):
+        """Test feed entries are yielded in order from a file-like object"""
+        import io
+        from arxiv_parser import ENTRY_TAG, iter_entries
+        
+        feed = b'''<feed xmlns="http://www.w3.org/2005/Atom">
+            <title>Results</title>
+            <entry><id>http://arxiv.org/abs/2301.00001v1</id></entry>
+            <entry><id>http://arxiv.org/abs/2301.00002v1</id></entry>
+        </feed>'''
+        
+        ids = [(entry.tag, entry[0].text) for entry in iter_entries(io.BytesIO(feed))]
+        assert ids == [(ENTRY_TAG, 'http://arxiv.org/abs/2301.00001v1'),
+                       (ENTRY_TAG, 'http://arxiv.org/abs/2301.00002v1')]
+    
+    @patch('arxiv_downloader.requests.get')
+    def test_search_papers_cached(self, mock_get):
+        """Test search results are cached before search_papers returns"""
+        mock_response = Mock()
+        mock_response.text = '''<feed xmlns="http://www.w3.org/2005/Atom">
+            <entry>
+                <id>http://arxiv.org/abs/2301.00003v1</id>
+                <title>Cached Paper</title>
+                <summary>Test abstract</summary>
+                <author><name>Test Author</name></author>
+                <link href="http://arxiv.org/pdf/2301.00003v1.pdf" type="application/pdf"/>
+            </entry>
+        </feed>'''
+        mock_get.return_value = mock_response
+
+        query = "ti:background_cache_test"
+        self.downloader.search_papers(query=query, max_results=1)
+
+        query_hash = generate_query_hash(query, None, None, 1)
+        cached = self.downloader.cache_manager.get_search_results(query_hash)
+        assert Paper.from_tuple(cached[0]).title == "Cached Paper"
+
+    @patch('arxiv_downloader.requests.get')
+    def test_download_papers_by_ids(self, mock_get):
+        """Test IDs resolved in a single API request"""
+        mock_response = Mock()
+        mock_response.text = '''<feed xmlns="http://www.w3.org/2005/Atom">
+            <entry>
+                <id>http://arxiv.org/abs/2301.00001v2</id>
+                <title>Test Paper</title>
+                <summary>Test abstract</summary>
+                <author><name>Test Author</name></author>
+                <link href="http://arxiv.org/pdf/2301.00001v2.pdf" type="application/pdf"/>
+            </entry>
+        </feed>'''
+        mock_get.return_value = mock_response
+
+        with patch.object(self.downloader, 'download_pdf', return_value=True) as mock_download:
+            results = self.downloader.download_papers_by_ids(['2301.00001v1', '2301.99999'])
+
+        assert mock_get.call_count == 1
+        assert mock_get.call_args[1]['params']['id_list'] == '2301.00001,2301.99999'
+        assert results == {'2301.00001v1': True, '2301.99999': False}
+        mock_download.assert_called_once()
+
+    @patch('arxiv_downloader.requests.get')
+    def test_download_papers_by_old_style_ids(self, mock_get):
+        """Test old-style IDs with an archive prefix are matched to their papers"""
+        mock_response = Mock()
+        mock_response.text = '''<feed xmlns="http://www.w3.org/2005/Atom">
+            <entry>
+                <id>http://arxiv.org/abs/hep-th/9901001v1</id>
+                <title>Old Paper</title>
+                <summary>Test abstract</summary>
+                <author><name>Test Author</name></author>
+                <link href="http://arxiv.org/pdf/hep-th/9901001v1" type="application/pdf"/>
+            </entry>
+        </feed>'''
+        mock_get.return_value = mock_response
+
+        with patch.object(self.downloader, 'download_pdf', return_value=True) as mock_download:
+            results = self.downloader.download_papers_by_ids(['hep-th/9901001', 'math/9901001'])
+
+        assert results == {'hep-th/9901001': True, 'math/9901001': False}
+        mock_download.assert_called_once()
+
+    @patch('arxiv_downloader.requests.get')
+    def test_download_papers_by_ids_batched(self, mock_get):
+        """Test IDs split into batches of Config.ID_BATCH_SIZE"""
+        mock_response = Mock()
+        mock_response.text = '<feed xmlns="http://www.w3.org/2005/Atom"></feed>'
+        mock_get.return_value = mock_response
+
+        with patch.object(Config, 'ID_BATCH_SIZE', 2):
+            results = self.downloader.download_papers_by_ids(['2301.00001', '2301.00002', '2301.00003'])
+
+        assert [c[1]['params']['id_list'] for c in mock_get.call_args_list] == [
+            '2301.00001,2301.00002', '2301.00003'
+        ]
+        assert not any(results.values())
+
     @patch('arxiv_downloader.requests.get')
     def test_download_pdf_success(self, mock_get):
         """Test successful PDF download"""
@@ -244,6 +470,40 @@ class TestArxivDownloader:
         
         assert result == True
         assert self.downloader.stats.successful_downloads == 1
+        assert self.downloader.paper_filepath(paper).exists()
+    
+    def test_stats_updated_from_threads(self):
+        """Test concurrent download counters lose no updates"""
+        stats = self.downloader.stats
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            for _ in range(1000):
+                pool.submit(stats.add_success)
+        
+        assert stats.successful_downloads == 1000
+    
+    @patch('arxiv_downloader.requests.get')
+    def test_download_pdf_interrupted_leaves_no_file(self, mock_get):
+        """Test interrupted download removes its temporary file"""
+        paper = Paper(
+            id='test_id',
+            title='Test Paper',
+            authors=['Test Author'],
+            abstract='Test abstract',
+            pdf_url='http://example.com/test.pdf',
+            published='2023-01-01',
+            categories=['cs.AI']
+        )
+        
+        def broken_stream(chunk_size):
+            yield b'partial'
+            raise IOError("connection reset")
+        
+        mock_response = Mock()
+        mock_response.iter_content.side_effect = broken_stream
+        mock_get.return_value = mock_response
+        
+        assert self.downloader.download_pdf(paper) == False
+        assert list(Path(self.temp_dir).iterdir()) == []
     
     @patch('arxiv_downloader.requests.get')
     def test_download_pdf_network_error(self, mock_get):
@@ -6,18 +6,30 @@ Test async downloader, plugin system and other new features
 """
 
 import pytest
+import os
 import asyncio
+import dataclasses
+import importlib.util
+import io
+import aiohttp
+import sqlite3
+import urllib3
 import tempfile
+import time
 from pathlib import Path
-from unittest.mock import Mock, patch, AsyncMock
+from unittest.mock import Mock, MagicMock, patch, AsyncMock, ANY
 
-from models import Paper, ValidationError
-from async_downloader import AsyncArxivDownloader, download_papers_async
+from models import Paper, ValidationError, NetworkError, RateLimitError
+from async_downloader import AsyncArxivDownloader, AsyncRateLimiter, download_papers_async
+from enhanced_arxiv_api import (
+    EnhancedArxivAPI, SearchQuery, SearchField, DateRange, search_by_author, get_recent_papers, _get_default_client
+)
 from plugins import (
     PluginManager, DuplicateCheckPlugin, CategoryFilterPlugin,
     MetadataPlugin, StatisticsPlugin, create_default_plugins
 )
 from config import Config
+from cache import CacheManager, TTLCache
 
 class TestPaperValidation:
     """Test paper data validation"""
@@ -108,6 +120,12 @@ class TestAsyncDownloader:
             )
         ]
     
+    @staticmethod
+    async def _chunks(*chunks):
+        """Async iterator standing in for aiohttp's iter_chunked"""
+        for chunk in chunks:
+            yield chunk
+    
     @pytest.mark.asyncio
     async def test_async_downloader_init(self, temp_dir):
         """Test async downloader initialization"""
@@ -115,6 +133,26 @@ class TestAsyncDownloader:
             assert downloader.download_dir == temp_dir
             assert downloader.session is not None
     
+    @pytest.mark.asyncio
+    async def test_async_downloader_shared_session(self, temp_dir):
+        """Test injected session is reused and left open"""
+        async with aiohttp.ClientSession() as session:
+            async with AsyncArxivDownloader(str(temp_dir), session=session) as downloader:
+                assert downloader.session is session
+            
+            assert not session.closed
+    
+    @pytest.mark.asyncio
+    async def test_async_downloader_connector(self, temp_dir):
+        """Test connection pool is sized to the concurrency limit"""
+        async with AsyncArxivDownloader(str(temp_dir), max_concurrent=20) as downloader:
+            assert downloader.session.connector.limit == 20
+            assert downloader.session.connector.limit_per_host == Config.MAX_CONNECTIONS_PER_HOST
+        
+        connector = aiohttp.TCPConnector(limit=3)
+        async with AsyncArxivDownloader(str(temp_dir), connector=connector) as downloader:
+            assert downloader.session.connector is connector
+    
     @pytest.mark.asyncio
     async def test_async_download_papers_mock(self, temp_dir, sample_papers):
         """Test async download (mocked)"""
@@ -123,14 +161,360 @@ class TestAsyncDownloader:
             with patch.object(downloader.session, 'get') as mock_get:
                 mock_response = AsyncMock()
                 mock_response.status = 200
-                mock_response.read = AsyncMock(return_value=b'fake pdf content')
+                mock_response.headers = {}
+                mock_response.content = Mock()
+                mock_response.content.iter_chunked = lambda size: self._chunks(b'fake pdf ', b'content')
                 mock_get.return_value.__aenter__.return_value = mock_response
                 
                 result = await downloader.download_papers_async(sample_papers)
                 
-                assert result['successful'] >= 0
+                assert result['successful'] == len(sample_papers)
+                assert (temp_dir / "2301.00001_Test Paper 1.pdf").read_bytes() == b'fake pdf content'
                 assert result['total_time'] > 0
                 assert isinstance(result['stats'], type(downloader.stats))
+    
+    @pytest.mark.asyncio
+    async def test_async_download_without_aiofiles(self, temp_dir, sample_papers):
+        """Test file writes fall back to the thread pool when aiofiles is missing"""
+        async with AsyncArxivDownloader(str(temp_dir)) as downloader:
+            with patch('async_downloader.aiofiles', None), \
+                 patch.object(downloader.session, 'get') as mock_get:
+                mock_response = AsyncMock()
+                mock_response.status = 200
+                mock_response.headers = {}
+                mock_response.content = Mock()
+                mock_response.content.iter_chunked = lambda size: self._chunks(b'fake pdf ', b'content')
+                mock_get.return_value.__aenter__.return_value = mock_response
+                
+                assert await downloader.download_with_retry_async(sample_papers[0]) is True
+        
+        assert (temp_dir / "2301.00001_Test Paper 1.pdf").read_bytes() == b'fake pdf content'
+
+    @pytest.mark.asyncio
+    async def test_async_download_failures_counted(self, temp_dir, sample_papers):
+        """Test failed downloads are recorded per paper"""
+        async with AsyncArxivDownloader(str(temp_dir), max_concurrent=2) as downloader:
+            with patch.object(downloader.session, 'get', side_effect=RuntimeError("boom")):
+                result = await downloader.download_papers_async(sample_papers)
+                
+                assert result['failed'] == len(sample_papers)
+                assert result['successful'] == 0
+                assert downloader.stats.total_papers == len(sample_papers)
+
+    @pytest.mark.asyncio
+    async def test_async_download_skips_oversized_pdf(self, temp_dir, sample_papers):
+        """Test PDFs reported above the size cap are skipped without reading the body"""
+        async with AsyncArxivDownloader(str(temp_dir), max_concurrent=2) as downloader:
+            with patch.object(downloader.session, 'head') as mock_head, \
+                 patch.object(downloader.session, 'get') as mock_get, \
+                 patch.object(downloader, '_write_stream') as mock_write:
+                mock_response = AsyncMock()
+                mock_response.status = 200
+                mock_response.headers = {'Content-Length': str(Config.MAX_PDF_BYTES + 1)}
+                mock_get.return_value.__aenter__.return_value = mock_response
+                
+                result = await downloader.download_papers_async(sample_papers)
+                
+                assert result['skipped'] == len(sample_papers)
+                assert mock_get.call_count == len(sample_papers)
+                mock_head.assert_not_called()
+                mock_write.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_existing_papers_skipped_before_download(self, temp_dir, sample_papers):
+        """Test papers already on disk are skipped without spawning downloads"""
+        (temp_dir / "2301.00001_Test Paper 1.pdf").write_bytes(b'pdf')
+        
+        async with AsyncArxivDownloader(str(temp_dir)) as downloader:
+            with patch.object(downloader, '_download_single_async', return_value=True) as mock_download:
+                result = await downloader.download_papers_async(sample_papers)
+        
+        assert result['skipped'] == 1
+        assert result['successful'] == 1
+        mock_download.assert_called_once_with(
+            sample_papers[1], ANY, temp_dir / "2301.00002_Test Paper 2.pdf"
+        )
+    
+    @pytest.mark.asyncio
+    async def test_download_from_local_mirror(self, temp_dir, sample_papers):
+        """Test papers present in the local mirror are copied instead of fetched"""
+        mirror_dir = temp_dir / "mirror"
+        mirror_dir.mkdir()
+        (mirror_dir / "2301.00001.pdf").write_bytes(b'mirrored pdf')
+        
+        async with AsyncArxivDownloader(str(temp_dir)) as downloader:
+            with patch.object(Config, 'LOCAL_MIRROR_PATH', str(mirror_dir)), \
+                 patch.object(downloader.session, 'get') as mock_get:
+                assert await downloader._download_single_async(sample_papers[0]) is True
+            
+            mock_get.assert_not_called()
+        
+        assert (temp_dir / "2301.00001_Test Paper 1.pdf").read_bytes() == b'mirrored pdf'
+    
+    @pytest.mark.asyncio
+    async def test_duplicate_downloads_share_request(self, temp_dir, sample_papers):
+        """Test concurrent downloads of the same paper run once"""
+        downloader = AsyncArxivDownloader(str(temp_dir))
+        
+        async def slow_download(paper, filepath):
+            await asyncio.sleep(0.01)
+            return True
+        
+        with patch.object(downloader, '_download_paper', side_effect=slow_download) as mock_download:
+            results = await asyncio.gather(
+                downloader._download_single_async(sample_papers[0]),
+                downloader._download_single_async(sample_papers[0])
+            )
+        
+        assert results == [True, True]
+        assert mock_download.call_count == 1
+        assert not downloader._inflight
+    
+    def test_backoff_delay_jitter_and_cap(self):
+        """Test retry backoff stays within jitter range and cap"""
+        for attempt in range(3):
+            base = (2 ** attempt) * Config.RETRY_DELAY_BASE
+            delay = AsyncArxivDownloader._backoff_delay(attempt)
+            assert base <= delay <= base * (1 + Config.RETRY_JITTER)
+        
+        assert AsyncArxivDownloader._backoff_delay(20) == Config.RETRY_MAX_DELAY
+    
+    @pytest.mark.asyncio
+    async def test_retry_skips_client_errors(self, temp_dir, sample_papers):
+        """Test 404 responses are not retried"""
+        downloader = AsyncArxivDownloader(str(temp_dir))
+        error = NetworkError("HTTP 404: Not Found", status=404)
+        with patch.object(downloader, '_download_single_async', side_effect=error) as mock_download:
+            assert await downloader.download_with_retry_async(sample_papers[0]) is False
+        
+        assert mock_download.call_count == 1
+    
+    @pytest.mark.asyncio
+    async def test_retry_honors_retry_after(self, temp_dir, sample_papers):
+        """Test rate limited retries wait at least Retry-After seconds"""
+        downloader = AsyncArxivDownloader(str(temp_dir))
+        error = RateLimitError("HTTP 429: Too Many Requests", status=429, retry_after=120)
+        with patch.object(downloader, '_download_single_async', side_effect=[error, True]), \
+             patch('async_downloader.asyncio.sleep', new=AsyncMock()) as mock_sleep:
+            assert await downloader.download_with_retry_async(sample_papers[0]) is True
+        
+        mock_sleep.assert_awaited_once_with(120)
+    
+    @pytest.mark.asyncio
+    async def test_rate_limiter_spaces_requests(self):
+        """Test rate limiter releases requests one interval apart"""
+        limiter = AsyncRateLimiter(1, 0.05)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        for _ in range(3):
+            async with limiter:
+                pass
+        
+        assert loop.time() - start >= 0.1
+    
+    @pytest.mark.asyncio
+    async def test_prewarm_ignores_errors(self, temp_dir, sample_papers):
+        """Test connection prewarm never raises"""
+        async with AsyncArxivDownloader(str(temp_dir)) as downloader:
+            with patch.object(downloader.session, 'head', side_effect=aiohttp.ClientError("unreachable")):
+                await downloader.prewarm(sample_papers[0].pdf_url)
+
+class TestEnhancedArxivAPI:
+    """Test enhanced API client"""
+    
+    @pytest.fixture
+    def temp_dir(self):
+        """Temporary directory fixture"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+    
+    @staticmethod
+    def _feed(*paper_ids):
+        entries = ''.join(
+            f'<entry><id>http://arxiv.org/abs/{paper_id}v1</id><title>Paper {paper_id}</title>'
+            f'<summary>Abstract</summary><author><name>Author</name></author>'
+            f'<link href="http://arxiv.org/pdf/{paper_id}v1" type="application/pdf"/></entry>'
+            for paper_id in paper_ids
+        )
+        return f'<feed xmlns="http://www.w3.org/2005/Atom">{entries}</feed>'
+    
+    @pytest.mark.asyncio
+    async def test_search_papers_async_pages(self):
+        """Test large searches are split into concurrently fetched pages"""
+        pages = {0: self._feed('2301.00001', '2301.00002'), 2: self._feed('2301.00003')}
+        
+        async def fake_request(session, params, semaphore, rate_limiter):
+            return pages[params['start']].encode('utf-8')
+        
+        with EnhancedArxivAPI() as api:
+            with patch.object(api, '_make_request_async', side_effect=fake_request) as mock_request:
+                papers = await api.search_papers_async(query="test", max_results=3, page_size=2)
+        
+        assert [paper.id for paper in papers] == ['2301.00001v1', '2301.00002v1', '2301.00003v1']
+        assert [c.args[1]['max_results'] for c in mock_request.call_args_list] == [2, 1]
+        # One limiter spaces every page request of the search
+        limiters = {id(c.args[3]) for c in mock_request.call_args_list}
+        assert len(limiters) == 1
+    
+    def test_search_papers_paginated(self):
+        """Test large searches are split into pages fetched on threads"""
+        pages = {0: self._feed('2301.00001', '2301.00002'), 2: self._feed('2301.00003')}
+        
+        def fake_get(url, params, **kwargs):
+            return MagicMock(raw=io.BytesIO(pages[params['start']].encode('utf-8')))
+        
+        with EnhancedArxivAPI() as api:
+            with patch.object(api.session, 'get', side_effect=fake_get) as mock_get:
+                papers = api.search_papers_paginated(query="test", max_results=3, page_size=2)
+        
+        assert [paper.id for paper in papers] == ['2301.00001v1', '2301.00002v1', '2301.00003v1']
+        assert sorted(c.kwargs['params']['max_results'] for c in mock_get.call_args_list) == [1, 2]
+    
+    def test_responses_served_from_cache(self, temp_dir):
+        """Test repeated requests are answered from the response cache"""
+        with CacheManager(temp_dir) as cache, EnhancedArxivAPI(cache=cache) as api:
+            with patch.object(api.session, 'get') as mock_get:
+                mock_get.return_value.content = self._feed('2301.00001').encode('utf-8')
+                first = api.search_papers(query="test", max_results=1)
+                second = api.search_papers(query="test", max_results=1)
+        
+        assert mock_get.call_count == 1
+        assert [paper.id for paper in first] == [paper.id for paper in second] == ['2301.00001v1']
+    
+    def test_iter_papers_streams_response(self):
+        """Test iter_papers parses the raw response body incrementally"""
+        with EnhancedArxivAPI() as api:
+            with patch.object(api.session, 'get') as mock_get:
+                mock_get.return_value.raw = io.BytesIO(
+                    self._feed('2301.00001', '2301.00002').encode('utf-8'))
+                papers = api.iter_papers(query="test", max_results=2)
+                
+                mock_get.assert_not_called()
+                assert next(papers).id == '2301.00001v1'
+                assert [paper.id for paper in papers] == ['2301.00002v1']
+        
+        assert mock_get.call_args.kwargs['stream'] is True
+    
+    def test_dropped_stream_raises_network_error(self):
+        """Test a connection lost mid-feed surfaces as NetworkError"""
+        body = self._feed('2301.00001', '2301.00002').encode('utf-8')
+        
+        class DroppedBody(io.RawIOBase):
+            """Body that yields its first half, then fails like a dropped connection"""
+            def __init__(self):
+                self.data = io.BytesIO(body[:len(body) // 2])
+            
+            def readable(self):
+                return True
+            
+            def readinto(self, buffer):
+                count = self.data.readinto(buffer)
+                if not count:
+                    raise urllib3.exceptions.ProtocolError("Connection broken")
+                return count
+        
+        with EnhancedArxivAPI() as api:
+            with patch.object(api.session, 'get') as mock_get:
+                mock_get.return_value.raw = DroppedBody()
+                with pytest.raises(NetworkError, match="Connection broken"):
+                    api.search_papers(query="test", max_results=2)
+    
+    def test_incomplete_entries_skipped(self):
+        """Test entries missing required fields are dropped with one summary warning"""
+        body = self._feed('2301.00001', '2301.00002', '2301.00003').replace(
+            '<title>Paper 2301.00002</title>', '').encode('utf-8')
+        with EnhancedArxivAPI() as api:
+            with patch.object(api, 'log_warning') as mock_warning:
+                papers = api._parse_response(body)
+        
+        assert [paper.id for paper in papers] == ['2301.00001v1', '2301.00003v1']
+        mock_warning.assert_called_once_with(ANY, 1, 3)
+    
+    def test_repeated_searches_served_from_memory(self):
+        """Test identical searches reuse parsed results without a request"""
+        with EnhancedArxivAPI() as api:
+            with patch.object(api.session, 'get') as mock_get:
+                mock_get.return_value.raw = io.BytesIO(self._feed('2301.00001').encode('utf-8'))
+                first = api.search_papers(query="test", max_results=1)
+                first[0].pdf_url = "https://export.arxiv.org/pdf/2301.00001v1"
+                first[0].authors.append("Someone Else")
+                second = api.search_papers(query="test", max_results=1)
+        
+        assert mock_get.call_count == 1
+        assert second[0].pdf_url == "http://arxiv.org/pdf/2301.00001v1"
+        assert second[0].authors == ["Author"]
+    
+    def test_retries_handled_by_adapter(self):
+        """Test request retries are configured on the session's adapter"""
+        with EnhancedArxivAPI(max_retries=3, retry_delay=1.5) as api:
+            retry = api.session.get_adapter(api.BASE_URL).max_retries
+        
+        assert retry.total == 2
+        assert retry.backoff_factor == 1.5
+        assert 429 in retry.status_forcelist
+    
+    def test_query_objects_frozen_and_memoized(self):
+        """Test query strings are cached and query objects cannot change under them"""
+        query = SearchQuery(terms=["graph neural", "attention"], field=SearchField.TITLE, operator="OR")
+        date_range = DateRange("2024-12-01", "2024-12-03")
+        
+        assert query.to_string() == 'ti:("graph neural" OR attention)'
+        assert date_range.to_query_string() == "submittedDate:[20241201 TO 20241203]"
+        assert SearchQuery(["graph neural", "attention"], SearchField.TITLE, "OR").to_string() is query.to_string()
+        assert query.terms == ("graph neural", "attention")
+        assert hash(query) == hash(SearchQuery(("graph neural", "attention"), SearchField.TITLE, "OR"))
+        
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            date_range.start_date = "2024-01-01"
+    
+    def test_id_lookups_skip_sorting(self):
+        """Test sort parameters are only sent for real searches"""
+        with EnhancedArxivAPI() as api:
+            assert 'sortBy' not in api._build_query_params(id_list=['2301.00001'])
+            assert 'sortBy' not in api._build_query_params(query='id:2301.00001')
+            assert api._build_query_params(query='test')['sortBy'] == 'relevance'
+    
+    def test_collapse_categories(self):
+        """Test categories of one archive can be queried as an archive wildcard"""
+        with EnhancedArxivAPI() as api:
+            categories = ['cs.AI', 'cs.LG']
+            assert (api._build_query_params(categories=categories)['search_query']
+                    == '(cat:cs.AI OR cat:cs.LG)')
+            assert (api._build_query_params(categories=categories, collapse_categories=True)
+                    ['search_query'] == 'cat:cs.*')
+            assert (api._build_query_params(categories=['cs.AI', 'math.CO'], collapse_categories=True)
+                    ['search_query'] == '(cat:cs.AI OR cat:math.CO)')
+    
+    @pytest.mark.skipif(importlib.util.find_spec('httpx') is not None, reason="httpx installed")
+    def test_http2_requires_httpx(self):
+        """Test HTTP/2 mode fails clearly without httpx"""
+        with pytest.raises(ValidationError, match="httpx"):
+            EnhancedArxivAPI(use_http2=True)
+    
+    def test_default_client_reused(self):
+        """Test convenience functions fall back to one shared client"""
+        client = _get_default_client()
+        with patch.object(client, 'search_papers', return_value=[]) as mock_search:
+            search_by_author("Author")
+            search_by_author("Another Author")
+        
+        assert client is _get_default_client()
+        assert mock_search.call_count == 2
+    
+    def test_convenience_functions_share_client(self):
+        """Test convenience functions reuse a caller-supplied client"""
+        with EnhancedArxivAPI() as api:
+            with patch.object(api.session, 'get') as mock_get, \
+                    patch.object(api.session, 'close') as mock_close:
+                mock_get.side_effect = lambda *args, **kwargs: MagicMock(
+                    raw=io.BytesIO(self._feed('2301.00001').encode('utf-8')))
+                papers = search_by_author("Author", max_results=1, api=api)
+                recent = get_recent_papers("cs.AI", max_results=1, api=api)
+                
+                assert mock_get.call_count == 2
+                mock_close.assert_not_called()
+        
+        assert [paper.id for paper in papers + recent] == ['2301.00001v1'] * 2
 
 class TestPluginSystem:
     """Test plugin system"""
@@ -172,6 +556,14 @@ class TestPluginSystem:
         # Second time should skip (same ID)
         assert plugin.pre_download(sample_paper) is False
     
+    def test_duplicate_check_existing_ids(self, temp_dir, sample_paper):
+        """Test pre-scanned IDs are used without reading the directory"""
+        with patch('plugins.scan_downloaded_ids') as mock_scan:
+            plugin = DuplicateCheckPlugin(temp_dir, existing_ids={sample_paper.id})
+            assert plugin.pre_download(sample_paper) is False
+        
+        mock_scan.assert_not_called()
+    
     def test_category_filter_plugin(self, sample_paper):
         """Test category filter plugin"""
         # Test allowed category
@@ -281,5 +673,93 @@ class TestConfig:
         assert isinstance(log_dir, Path)
         assert 'log' in str(log_dir).lower() or '.log' in str(log_dir)
 
+class TestCacheManager:
+    """Test SQLite cache manager"""
+    
+    @pytest.fixture
+    def cache(self):
+        """Cache manager in a temporary directory"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manager = CacheManager(Path(tmpdir))
+            yield manager
+            manager.close()
+    
+    def test_save_and_get(self, cache):
+        """Test cached entries round trip"""
+        cache.save_paper_info("2301.00001", {"title": "Test Paper"})
+        cache.save_search_results("abc123", [["2301.00001", "Test Paper"]])
+        
+        assert cache.get_paper_info("2301.00001") == {"title": "Test Paper"}
+        assert cache.get_search_results("abc123") == [["2301.00001", "Test Paper"]]
+        assert cache.get_search_results("missing") is None
+        assert cache.get_cache_stats() == {
+            'paper_cache_count': 1, 'search_cache_count': 1, 'response_cache_count': 0
+        }
+    
+    def test_cached_values_not_shared(self, cache):
+        """Test modifying a saved or returned value leaves later hits unchanged"""
+        results = [["2301.00001", "Test Paper", ["Author"]]]
+        cache.save_search_results("abc123", results)
+        results[0][2].append("Saved Later")
+        
+        cache.get_search_results("abc123")[0][2].append("Returned Later")
+        
+        assert cache.get_search_results("abc123") == [["2301.00001", "Test Paper", ["Author"]]]
+    
+    def test_expired_entries_removed(self, cache):
+        """Test expired entries are not returned and are cleared"""
+        cache.save_search_results("old", [])
+        cache.save_search_results("stale", [])
+        
+        expired = time.time() + Config.SEARCH_CACHE_TTL + 1
+        with patch('cache.time.time', return_value=expired):
+            assert cache.get_search_results("old") is None
+            cache.clear_expired_cache()
+        
+        assert cache.get_cache_stats()['search_cache_count'] == 0
+    
+    def test_writes_buffered_until_flush(self, cache):
+        """Test saves are batched and persisted on close"""
+        cache.save_paper_info("2301.00001", {"title": "Test Paper"})
+        assert cache.get_paper_info("2301.00001") == {"title": "Test Paper"}
+        
+        with sqlite3.connect(str(cache.db_path)) as conn:
+            assert conn.execute('SELECT COUNT(*) FROM papers').fetchone()[0] == 0
+        
+        cache.close()
+        
+        with CacheManager(cache.cache_dir) as reopened:
+            assert reopened.get_paper_info("2301.00001") == {"title": "Test Paper"}
+    
+    def test_memory_cache_lru_and_expiry(self):
+        """Test in-memory layer evicts least recently used and expired entries"""
+        memory = TTLCache(maxsize=2, ttl=60)
+        memory.set("a", 1)
+        memory.set("b", 2)
+        memory.get("a")
+        memory.set("c", 3)
+        
+        assert memory.get("b") is None
+        assert memory.get("a") == 1
+        
+        memory.set("d", 4, expires_at=time.time() - 1)
+        assert memory.get("d") is None
+    
+    def test_legacy_json_files_expire_by_mtime(self, cache):
+        """Test expired JSON files from the old cache layout are removed"""
+        legacy_dir = cache.cache_dir / 'searches'
+        legacy_dir.mkdir()
+        old_file = legacy_dir / 'old.json'
+        new_file = legacy_dir / 'new.json'
+        old_file.write_text('{}')
+        new_file.write_text('{}')
+        old_time = time.time() - Config.SEARCH_CACHE_TTL - 1
+        os.utime(old_file, (old_time, old_time))
+        
+        cache.clear_expired_cache()
+        
+        assert not old_file.exists()
+        assert new_file.exists()
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
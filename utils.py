@@ -1,9 +1,17 @@
 """Utility functions module"""
 
+import os
 import re
 import hashlib
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from pathlib import Path
-from typing import Union, Optional
+from typing import Union, Optional, Set
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
 
 from config import Config
 
@@ -21,9 +29,9 @@ def sanitize_filename(title: str, max_length: Optional[int] = None) -> str:
         max_length = Config.MAX_FILENAME_LENGTH
     
     # Remove or replace invalid filename characters
-    title = re.sub(Config.INVALID_CHARS_PATTERN, '', title)
+    title = Config.INVALID_CHARS_RE.sub('', title)
     # Replace multiple spaces with single space
-    title = re.sub(Config.WHITESPACE_PATTERN, ' ', title)
+    title = Config.WHITESPACE_RE.sub(' ', title)
     # Remove leading and trailing spaces
     title = title.strip()
     
@@ -68,6 +76,35 @@ def get_file_size_mb(filepath: Union[str, Path]) -> float:
     except (OSError, FileNotFoundError):
         return 0.0
 
+def drop_page_cache(file_obj) -> None:
+    """Flush a written file to disk and drop its pages from the OS page cache
+    
+    Downloaded PDFs are written once and rarely read back, so keeping them
+    cached only evicts pages other processes need. No-op where
+    posix_fadvise is unavailable (non-Linux platforms).
+    
+    Args:
+        file_obj: Open binary file object
+    """
+    if not Config.DROP_PAGE_CACHE or not hasattr(os, 'posix_fadvise'):
+        return
+    
+    file_obj.flush()
+    drop_page_cache_fd(file_obj.fileno())
+
+def drop_page_cache_fd(fd: int) -> None:
+    """Drop an already flushed file descriptor's pages from the OS page cache
+    
+    Args:
+        fd: File descriptor of a file whose writes have been flushed
+    """
+    if not Config.DROP_PAGE_CACHE or not hasattr(os, 'posix_fadvise'):
+        return
+    
+    # Dirty pages cannot be dropped, so write them out first
+    os.fsync(fd)
+    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+
 def ensure_directory(directory: Union[str, Path]) -> Path:
     """Ensure directory exists
     
@@ -96,6 +133,78 @@ def is_valid_date_format(date_str: str) -> bool:
     pattern = r'^\d{4}-\d{2}-\d{2}$'
     return bool(re.match(pattern, date_str))
 
+def strip_arxiv_version(paper_id: str) -> str:
+    """Remove version suffix from ArXiv ID
+    
+    Args:
+        paper_id: ArXiv ID, e.g. 2301.00001v2 or hep-th/9901001v1
+    
+    Returns:
+        ArXiv ID without version suffix
+    """
+    return re.sub(r'v\d+$', '', paper_id)
+
+def arxiv_id_from_url(url: str) -> str:
+    """Extract ArXiv ID from an abstract or PDF URL
+    
+    Args:
+        url: e.g. http://arxiv.org/pdf/hep-th/9901001v1
+    
+    Returns:
+        Full ArXiv ID, keeping the archive prefix of old-style IDs
+    """
+    for marker in ('/abs/', '/pdf/'):
+        index = url.find(marker)
+        if index != -1:
+            arxiv_id = url[index + len(marker):]
+            return arxiv_id[:-4] if arxiv_id.endswith('.pdf') else arxiv_id
+    return url[url.rfind('/') + 1:]
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse HTTP Retry-After header
+    
+    Args:
+        value: Header value, either delay seconds or an HTTP date
+    
+    Returns:
+        Seconds to wait, None if missing or unparseable
+    """
+    if not value:
+        return None
+    
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+def scan_downloaded_ids(directory: Union[str, Path]) -> Set[str]:
+    """Collect IDs of papers already downloaded into a directory
+    
+    Downloaded PDFs are named "<paper_id>_<title>.pdf", so a single directory
+    scan answers existence checks for a whole batch.
+    
+    Args:
+        directory: Download directory
+    
+    Returns:
+        Set of paper IDs, empty if the directory does not exist
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return {
+                entry.name.split('_', 1)[0]
+                for entry in entries
+                if entry.name.endswith('.pdf') and entry.is_file()
+            }
+    except FileNotFoundError:
+        return set()
+
 def format_file_size(size_bytes: int) -> str:
     """Format file size display
     
@@ -142,7 +251,7 @@ def clean_text(text: str) -> str:
     # Replace newlines with spaces
     text = text.replace('\n', ' ').replace('\r', ' ')
     # Replace multiple spaces with single space
-    text = re.sub(r'\s+', ' ', text)
+    text = Config.WHITESPACE_RE.sub(' ', text)
     # Remove leading and trailing spaces
     return text.strip()
 
@@ -207,4 +316,38 @@ def generate_unique_filename(base_path: Path, filename: str,
         new_filepath = base_path / new_filename
         if not new_filepath.exists():
             return new_filepath
-        counter += 1
\ No newline at end of file
+        counter += 1
+
+def create_http_session(max_retries: int = 0, backoff_factor: float = 0.5) -> requests.Session:
+    """Create a requests session with pooled keep-alive connections
+    
+    Reusing one session across calls avoids a TCP and TLS handshake per request.
+    
+    Args:
+        max_retries: Retries for failed connections and 429/5xx responses,
+            with exponential backoff; 0 leaves retrying to the caller
+        backoff_factor: Retry n waits backoff_factor * 2 ** (n - 1) seconds,
+            or the server's Retry-After when it sends one
+    
+    Returns:
+        Configured session
+    """
+    retry = Retry(
+        total=max_retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=(429, 500, 502, 503, 504),
+        raise_on_status=False
+    ) if max_retries else 0
+    adapter = HTTPAdapter(
+        pool_connections=Config.HTTP_POOL_CONNECTIONS,
+        pool_maxsize=Config.HTTP_POOL_MAXSIZE,
+        max_retries=retry
+    )
+    
+    session = requests.Session()
+    # Every content coding urllib3 can decode here: gzip and deflate, plus br
+    # and zstd when the optional brotli / zstandard packages are installed
+    session.headers['Accept-Encoding'] = make_headers(accept_encoding=True)['accept-encoding']
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
\ No newline at end of file